@@ -13,7 +13,6 @@ import shutil
 import subprocess
 import sys
 import struct
-import tempfile
 import time
 import urllib.error
 import urllib.request
@@ -1492,16 +1491,6 @@ def _build_control_block(
     return _h.build_control_block(control_size, input_ptr, input_len, output_ptr, output_len)
 
 
-def _write_account(
-    env: dict[str, str],
-    account_pubkey: str,
-    offset: int,
-    payload_path: Path,
-    chunk_size: int | None,
-) -> int:
-    return _h.write_account(env, account_pubkey, offset, payload_path, chunk_size)
-
-
 def _cmd_input_write(args: argparse.Namespace) -> int:
     manifest_path = Path(args.manifest)
     manifest = load_manifest(manifest_path)
@@ -1587,24 +1576,20 @@ def _cmd_input_write(args: argparse.Namespace) -> int:
     control_write_offset = MMU_VM_HEADER_SIZE + control_offset
     input_write_offset = MMU_VM_HEADER_SIZE + input_offset
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        input_path = tmp_path / "input.bin"
-        control_path = tmp_path / "control.bin"
-        input_path.write_bytes(payload_bytes)
-        control_path.write_bytes(control_bytes)
-
-        print(
-            f"Writing input ({len(payload_bytes)} bytes) to VM {vm_pubkey} "
-            f"@ 0x{input_write_offset:X}"
-        )
-        rc = _write_account(env, vm_pubkey, input_write_offset, input_path, args.chunk_size)
+    print(
+        f"Writing input ({len(payload_bytes)} bytes) to VM {vm_pubkey} "
+        f"@ 0x{input_write_offset:X}"
+    )
+    with _h.account_writer(env, vm_pubkey, args.chunk_size) as write:
+        rc, error = write(input_write_offset, payload_bytes)
         if rc != 0:
+            print(f"Input write failed: {error}", file=sys.stderr)
             return rc
 
         print(f"Writing control block ({len(control_bytes)} bytes) @ 0x{control_write_offset:X}")
-        rc = _write_account(env, vm_pubkey, control_write_offset, control_path, args.chunk_size)
+        rc, error = write(control_write_offset, control_bytes)
         if rc != 0:
+            print(f"Control write failed: {error}", file=sys.stderr)
             return rc
 
     print("Input staged in VM scratch.")
@@ -2195,13 +2180,12 @@ def _cmd_accounts_create_pda(
     mapped_path = Path(args.mapped_out) if args.mapped_out else Path("mapped_accounts.txt")
     mapped_path.write_text("\n".join(mapped_lines) + "\n")
 
-    rust_tools = Path(__file__).resolve().parent / "rust_tools"
-    cmd = ["cargo", "run", "--bin", "init_pda_accounts", "--", "--vm-seed", str(vm_seed)]
+    cmd = [*_h.rust_tool_command("init_pda_accounts"), "--vm-seed", str(vm_seed)]
     for spec in segment_specs:
         cmd.extend(["--segment", spec])
 
     print("Running:", " ".join(cmd))
-    proc = subprocess.run(cmd, env=env, cwd=str(rust_tools))
+    proc = subprocess.run(cmd, env=env, cwd=str(_h.RUST_TOOLS_DIR))
     return proc.returncode
 
 
@@ -2242,10 +2226,9 @@ def _prepare_pda_ops_env(
 
 
 def _run_pda_account_ops(env: dict[str, str], args: list[str]) -> int:
-    rust_tools = Path(__file__).resolve().parent / "rust_tools"
-    cmd = ["cargo", "run", "--bin", "pda_account_ops", "--", *args]
+    cmd = [*_h.rust_tool_command("pda_account_ops"), *args]
     print("Running:", " ".join(cmd))
-    proc = subprocess.run(cmd, env=env, cwd=str(rust_tools))
+    proc = subprocess.run(cmd, env=env, cwd=str(_h.RUST_TOOLS_DIR))
     return proc.returncode
 
 
@@ -7,17 +7,26 @@ imports them from this module so behaviour is identical.
 from __future__ import annotations
 
 import base64
+import contextlib
+import http.client
 import json
 import os
 import platform
 import re
 import struct
 import subprocess
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 from .accounts import (
     derive_segment_pda,
@@ -86,26 +95,31 @@ def runner_filename() -> str:
     return "frostbite-run-onchain"
 
 
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_BUNDLED_RUN_ONCHAIN: str | None = None
+
+
 def resolve_run_onchain() -> str:
+    global _BUNDLED_RUN_ONCHAIN
     env_path = os.environ.get("FROSTBITE_RUN_ONCHAIN")
     if env_path:
         return env_path
-    package_dir = Path(__file__).resolve().parent
+    if _BUNDLED_RUN_ONCHAIN is not None:
+        return _BUNDLED_RUN_ONCHAIN
     runner = runner_filename()
     tag = platform_tag()
+    candidates: list[Path] = []
     if tag:
-        bundled = package_dir / "bin" / tag / runner
-        if bundled.exists():
-            return str(bundled)
-        toolchain_bin = package_dir / "toolchain" / "bin" / tag / runner
-        if toolchain_bin.exists():
-            return str(toolchain_bin)
-    bundled = package_dir / "bin" / runner
-    if bundled.exists():
-        return str(bundled)
-    toolchain_bin = package_dir / "toolchain" / "bin" / runner
-    if toolchain_bin.exists():
-        return str(toolchain_bin)
+        candidates.append(_PACKAGE_DIR / "bin" / tag / runner)
+        candidates.append(_PACKAGE_DIR / "toolchain" / "bin" / tag / runner)
+    candidates.append(_PACKAGE_DIR / "bin" / runner)
+    candidates.append(_PACKAGE_DIR / "toolchain" / "bin" / runner)
+    for candidate in candidates:
+        if candidate.exists():
+            # Bundled runners do not move within a session; only the PATH
+            # fallback is re-checked so a later postinstall is picked up.
+            _BUNDLED_RUN_ONCHAIN = str(candidate)
+            return _BUNDLED_RUN_ONCHAIN
     return "frostbite-run-onchain"
 
 
@@ -140,24 +154,127 @@ def load_solana_cli_config() -> dict[str, str]:
 # ── RPC helpers ────────────────────────────────────────────────────
 
 
+def _orjson_loads(data: bytes | str) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN/Infinity literals that the stdlib accepts.
+        return json.loads(data)
+
+
+_loads = json.loads if orjson is None else _orjson_loads
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON with orjson when it is installed, else the stdlib.
+
+    orjson only represents integers up to 64 bits exactly, which covers every
+    Solana RPC field (lamports, slots, sizes).
+    """
+    return _loads(data)
+
+
+_RPC_RETRY_STATUSES = {429, 500, 502, 503, 504}
+_RPC_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_RPC_MAX_REDIRECTS = 5
+_RPC_CONNECTIONS = threading.local()
+
+
+def _rpc_connection(parts: urllib.parse.SplitResult, *, fresh: bool = False) -> http.client.HTTPConnection:
+    conns = getattr(_RPC_CONNECTIONS, "conns", None)
+    if conns is None:
+        conns = _RPC_CONNECTIONS.conns = {}
+    key = (parts.scheme, parts.netloc)
+    conn = conns.get(key)
+    if conn is not None and fresh:
+        conn.close()
+        conn = None
+    if conn is None:
+        conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = conn_cls(parts.hostname or "", parts.port)
+        conns[key] = conn
+    return conn
+
+
+def _rpc_post_keepalive(
+    parts: urllib.parse.SplitResult,
+    payload: bytes,
+) -> tuple[int, str, bytes, str | None]:
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+    headers = {"Content-Type": "application/json"}
+    for fresh in (False, True):
+        conn = _rpc_connection(parts, fresh=fresh)
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", target, body=payload, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, resp.reason, resp.read(), resp.getheader("Location")
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            # A pooled connection the server already closed fails on first
+            # use; reconnect once before treating it as a transport error.
+            if fresh or not reused:
+                raise
+    raise AssertionError("unreachable")
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    # urllib would turn a redirected POST into a bodyless GET; surface the 3xx
+    # instead so _rpc_post handles redirects the same way on both paths.
+    def redirect_request(self, req, fp, code, msg, headers, newurl):  # type: ignore[override]
+        return None
+
+
+def _rpc_post_urllib(url: str, payload: bytes) -> tuple[int, str, bytes, str | None]:
+    req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
+    opener = urllib.request.build_opener(_NoRedirectHandler())
+    try:
+        with opener.open(req) as resp:
+            return resp.status, resp.reason, resp.read(), None
+    except urllib.error.HTTPError as exc:
+        location = exc.headers.get("Location") if exc.headers is not None else None
+        return exc.code, str(exc.reason), b"", location
+
+
+def _rpc_post(url: str, payload: bytes) -> tuple[int, str, bytes]:
+    """POST ``payload`` to ``url``, re-posting it to the target of any redirect.
+
+    Pooled keep-alive connections are used unless a proxy is configured for
+    the scheme, in which case the request goes through ``urllib``.
+    """
+    for _ in range(_RPC_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme in {"http", "https"} and not urllib.request.getproxies().get(parts.scheme):
+            status, reason, body, location = _rpc_post_keepalive(parts, payload)
+        else:
+            status, reason, body, location = _rpc_post_urllib(url, payload)
+        if status not in _RPC_REDIRECT_STATUSES:
+            return status, reason, body
+        if not location:
+            raise ValueError(f"RPC HTTP {status} redirect from {url} has no Location header")
+        url = urllib.parse.urljoin(url, location)
+    raise ValueError(f"RPC endpoint redirected more than {_RPC_MAX_REDIRECTS} times (last: {url})")
+
+
 def rpc_request_raw(url: str, method: str, params: list) -> dict:
     payload = json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params}).encode()
-    req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
     retries = 6
     for attempt in range(retries + 1):
         try:
-            with urllib.request.urlopen(req) as resp:
-                return json.loads(resp.read().decode())
-        except urllib.error.HTTPError as exc:
-            if exc.code in {429, 500, 502, 503, 504} and attempt < retries:
-                time.sleep(0.25 * (2**attempt))
-                continue
-            raise ValueError(f"RPC HTTP error {exc.code}: {exc.reason}") from exc
-        except urllib.error.URLError as exc:
+            status, reason, body = _rpc_post(url, payload)
+        except (http.client.HTTPException, OSError) as exc:
             if attempt < retries:
                 time.sleep(0.25 * (2**attempt))
                 continue
             raise ValueError(f"RPC transport error: {exc}") from exc
+        if status >= 400:
+            if status in _RPC_RETRY_STATUSES and attempt < retries:
+                time.sleep(0.25 * (2**attempt))
+                continue
+            raise ValueError(f"RPC HTTP error {status}: {reason}")
+        return loads_json(body)
     raise ValueError("RPC request failed after retries")
 
 
@@ -426,6 +543,50 @@ def validate_vm_authority_binding(
         )
 
 
+# ── Rust tool launcher ─────────────────────────────────────────────
+
+
+RUST_TOOLS_DIR = _PACKAGE_DIR / "rust_tools"
+
+
+def _rust_sources_mtime_ns(rust_tools: Path) -> int:
+    newest = 0
+    for path in (rust_tools / "Cargo.toml", rust_tools / "Cargo.lock", *rust_tools.glob("src/**/*.rs")):
+        newest = max(newest, path.stat().st_mtime_ns)
+    return newest
+
+
+def rust_tool_command(name: str) -> list[str]:
+    """Return the argv prefix that runs the ``rust_tools`` binary ``name``.
+
+    An already-built binary under the cargo target dir is invoked directly when
+    it is newer than the crate sources, skipping cargo's manifest resolution
+    and freshness checks on every call. Otherwise falls back to ``cargo run``,
+    which builds the binary so later calls can use it directly.
+
+    The freshness check runs on every call (a few stats), so edited sources or
+    a removed binary are picked up without restarting.
+    """
+    target_dir = Path(os.environ.get("CARGO_TARGET_DIR") or "target")
+    if not target_dir.is_absolute():
+        target_dir = RUST_TOOLS_DIR / target_dir
+    exe_name = f"{name}.exe" if os.name == "nt" else name
+    try:
+        sources_mtime = _rust_sources_mtime_ns(RUST_TOOLS_DIR)
+    except OSError:
+        sources_mtime = None
+    if sources_mtime is not None:
+        for profile in ("release", "debug"):
+            candidate = target_dir / profile / exe_name
+            try:
+                built_mtime = candidate.stat().st_mtime_ns
+            except OSError:
+                continue
+            if built_mtime >= sources_mtime:
+                return [str(candidate)]
+    return ["cargo", "run", "--bin", name, "--"]
+
+
 # ── Account write helper ──────────────────────────────────────────
 
 
@@ -438,14 +599,9 @@ def write_account(
 ) -> int:
     if offset < 0 or offset > 0xFFFF_FFFF:
         raise ValueError("offset must fit in u32")
-    rust_tools = Path(__file__).resolve().parent / "rust_tools"
     payload_path = payload_path.resolve()
     cmd = [
-        "cargo",
-        "run",
-        "--bin",
-        "write_account",
-        "--",
+        *rust_tool_command("write_account"),
         account_pubkey,
         str(offset),
         str(payload_path),
@@ -453,10 +609,65 @@ def write_account(
     if chunk_size:
         cmd.extend(["--chunk-size", str(chunk_size)])
     print("Running:", " ".join(cmd))
-    proc = subprocess.run(cmd, env=env, cwd=str(rust_tools))
+    proc = subprocess.run(cmd, env=env, cwd=str(RUST_TOOLS_DIR))
     return proc.returncode
 
 
+@contextlib.contextmanager
+def account_writer(
+    env: dict[str, str],
+    account_pubkey: str,
+    chunk_size: int | None,
+) -> Iterator[Callable[[int, bytes], tuple[int, str]]]:
+    """Keep one ``write_account --jobs`` process open for several writes.
+
+    Yields ``write(offset, payload) -> (rc, error)``. ``rc`` is 0 on success,
+    with the same meaning as :func:`write_account`; on failure ``error``
+    carries the tool's message. Jobs run in call order on one RPC client and
+    payer, so the tool starts and loads the keypair only once.
+    """
+    cmd = [*rust_tool_command("write_account"), account_pubkey, "--jobs"]
+    if chunk_size:
+        cmd.extend(["--chunk-size", str(chunk_size)])
+    print("Running:", " ".join(cmd))
+    proc = subprocess.Popen(
+        cmd,
+        env=env,
+        cwd=str(RUST_TOOLS_DIR),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+    def write(offset: int, payload: bytes) -> tuple[int, str]:
+        if offset < 0 or offset > 0xFFFF_FFFF:
+            raise ValueError("offset must fit in u32")
+        try:
+            proc.stdin.write(json.dumps({"offset": offset, "hex": payload.hex()}) + "\n")
+            proc.stdin.flush()
+            reply = proc.stdout.readline().strip()
+        except BrokenPipeError:
+            reply = ""
+        status, _, detail = reply.partition(" ")
+        if status == "ok":
+            print(f"Wrote {detail} bytes to {account_pubkey}")
+            return 0, ""
+        if status == "err":
+            return 1, detail or "write_account reported an error"
+        # The tool exited without answering (build or startup failure).
+        rc = proc.wait() or 1
+        return rc, f"write_account exited (rc={rc}) before answering"
+
+    try:
+        yield write
+    finally:
+        with contextlib.suppress(BrokenPipeError):
+            proc.stdin.close()
+        proc.wait()
+        proc.stdout.close()
+
+
 # ── Environment builders ───────────────────────────────────────────
 
 
@@ -835,6 +1046,14 @@ def append_seeded_runner_args(
 
 
 def extract_last_execute_signature(output: str) -> str | None:
+    # The runner logs the final signature near the end, so anchor the regex
+    # at the last tag instead of scanning the whole output.
+    idx = output.rfind("TX exec-")
+    if idx < 0:
+        return None
+    match = EXEC_SIG_RE.match(output, idx)
+    if match:
+        return match.group(1)
     matches = EXEC_SIG_RE.findall(output)
     if not matches:
         return None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import json
 import struct
+import zlib
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
@@ -31,15 +32,8 @@ _DTYPE_STRUCT = {
 
 
 def _crc32(data: bytes) -> int:
-    crc = 0xFFFF_FFFF
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xEDB8_8320
-            else:
-                crc >>= 1
-    return (~crc) & 0xFFFF_FFFF
+    # IEEE CRC-32 (reflected 0xEDB88320), the variant the guest verifies.
+    return zlib.crc32(data) & 0xFFFF_FFFF
 
 
 def _flatten(values: Any) -> List[Any]:
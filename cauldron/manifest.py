@@ -16,7 +16,8 @@ def _load_toml_bytes(data: bytes) -> Dict[str, Any]:
 
 def load_manifest(path: str | Path) -> Dict[str, Any]:
     manifest_path = Path(path)
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
-    data = manifest_path.read_bytes()
+    try:
+        data = manifest_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}") from None
     return _load_toml_bytes(data)
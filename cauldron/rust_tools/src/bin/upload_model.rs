@@ -1,7 +1,9 @@
 use futures::stream::{FuturesUnordered, StreamExt};
+use solana_client::client_error::Result as ClientResult;
 use solana_client::nonblocking::rpc_client::RpcClient;
 use solana_sdk::{
     commitment_config::CommitmentConfig,
+    hash::Hash,
     instruction::{AccountMeta, Instruction},
     pubkey::Pubkey,
     signature::{Keypair, Signer},
@@ -12,7 +14,8 @@ use std::env;
 use std::path::{Path, PathBuf};
 use std::str::FromStr;
 use std::sync::Arc;
-use tokio::sync::Semaphore;
+use std::time::{Duration, Instant};
+use tokio::sync::{Mutex, Semaphore};
 
 const DEFAULT_SOLANA_CONFIG: &str = "~/.config/solana/cli/config.yml";
 const DEFAULT_RPC_URL: &str = "http://127.0.0.1:8899";
@@ -20,6 +23,8 @@ const DEFAULT_PAYER_KEYPAIR: &str = "~/.config/solana/id.json";
 const DEFAULT_PROGRAM_ID: &str = "FRsToriMLgDc1Ud53ngzHUZvCRoazCaGeGUuzkwoha7m";
 const CHUNK_SIZE: usize = 900;
 const CONCURRENCY: usize = 100;
+// Blockhashes stay valid for ~150 slots (~60s); refresh well inside that.
+const BLOCKHASH_MAX_AGE: Duration = Duration::from_secs(20);
 
 const BINARY_HEADER_SIZE: usize = 12;
 const BINARY_MAGIC: [u8; 4] = *b"RVCD";
@@ -251,6 +256,7 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     let target_account = upload_mode.target_account();
 
     let semaphore = Arc::new(Semaphore::new(CONCURRENCY));
+    let blockhashes = Arc::new(BlockhashCache::new(client.clone()));
     let data_ref = Arc::new(data);
 
     loop {
@@ -305,6 +311,7 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
         for chunk_idx in dirty_chunks {
             let permit = semaphore.clone().acquire_owned().await?;
             let client = client.clone();
+            let blockhashes = blockhashes.clone();
             let payer = payer.clone();
             let authority = authority.clone();
             let data = data_ref.clone();
@@ -323,7 +330,7 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
                     start,
                     chunk_data,
                 );
-                let bh = client.get_latest_blockhash().await.unwrap_or_default();
+                let bh = blockhashes.get().await?;
                 let tx = if payer.pubkey() == authority.pubkey() {
                     Transaction::new_signed_with_payer(
                         &[ix],
@@ -360,6 +367,34 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     Ok(())
 }
 
+/// Shares one recent blockhash across concurrent chunk writes instead of
+/// fetching a fresh one per transaction.
+struct BlockhashCache {
+    client: Arc<RpcClient>,
+    latest: Mutex<Option<(Hash, Instant)>>,
+}
+
+impl BlockhashCache {
+    fn new(client: Arc<RpcClient>) -> Self {
+        Self {
+            client,
+            latest: Mutex::new(None),
+        }
+    }
+
+    async fn get(&self) -> ClientResult<Hash> {
+        let mut latest = self.latest.lock().await;
+        if let Some((hash, fetched_at)) = *latest {
+            if fetched_at.elapsed() < BLOCKHASH_MAX_AGE {
+                return Ok(hash);
+            }
+        }
+        let hash = self.client.get_latest_blockhash().await?;
+        *latest = Some((hash, Instant::now()));
+        Ok(hash)
+    }
+}
+
 fn build_chunk_write_instruction(
     program_id: Pubkey,
     authority: Pubkey,
@@ -8,6 +8,7 @@ use solana_sdk::{
 };
 use std::env;
 use std::fs;
+use std::io::{BufRead, Read, Write};
 use std::path::PathBuf;
 use std::str::FromStr;
 
@@ -75,15 +76,91 @@ fn parse_offset(value: &str) -> Result<u32, Box<dyn std::error::Error>> {
     }
 }
 
+fn decode_hex(value: &str) -> Result<Vec<u8>, Box<dyn std::error::Error>> {
+    if value.len() % 2 != 0 || !value.is_ascii() {
+        return Err("hex payload must be an even-length ASCII string".into());
+    }
+    (0..value.len())
+        .step_by(2)
+        .map(|i| u8::from_str_radix(&value[i..i + 2], 16).map_err(|e| e.into()))
+        .collect()
+}
+
+fn write_payload(
+    client: &RpcClient,
+    payer: &Keypair,
+    frostbite_id: Pubkey,
+    target_pubkey: Pubkey,
+    base_offset: u32,
+    data: &[u8],
+    chunk_size: usize,
+) -> Result<(), Box<dyn std::error::Error>> {
+    let total = data.len();
+    let mut offset = base_offset as usize;
+    let mut start = 0usize;
+
+    while start < total {
+        let end = usize::min(start + chunk_size, total);
+        let chunk = &data[start..end];
+
+        let mut ix_data = Vec::with_capacity(1 + 4 + chunk.len());
+        ix_data.push(WRITE_ACCOUNT);
+        ix_data.extend_from_slice(&(offset as u32).to_le_bytes());
+        ix_data.extend_from_slice(chunk);
+
+        let ix = Instruction {
+            program_id: frostbite_id,
+            accounts: vec![
+                AccountMeta::new_readonly(payer.pubkey(), true),
+                AccountMeta::new(target_pubkey, false),
+            ],
+            data: ix_data,
+        };
+
+        let tx = Transaction::new_signed_with_payer(
+            &[ix],
+            Some(&payer.pubkey()),
+            &[payer as &dyn Signer],
+            client.get_latest_blockhash()?,
+        );
+        client.send_and_confirm_transaction(&tx)?;
+
+        start = end;
+        offset += chunk.len();
+    }
+    Ok(())
+}
+
+/// Parse one `{"offset": N, "hex": "..."}` job line and write it.
+fn run_job(
+    line: &str,
+    client: &RpcClient,
+    payer: &Keypair,
+    frostbite_id: Pubkey,
+    target_pubkey: Pubkey,
+    chunk_size: usize,
+) -> Result<usize, Box<dyn std::error::Error>> {
+    let job: serde_json::Value = serde_json::from_str(line)?;
+    let offset = job["offset"]
+        .as_u64()
+        .filter(|value| *value <= u32::MAX as u64)
+        .ok_or("job offset must fit in u32")?;
+    let data = decode_hex(job["hex"].as_str().ok_or("job is missing hex payload")?)?;
+    write_payload(client, payer, frostbite_id, target_pubkey, offset as u32, &data, chunk_size)?;
+    Ok(data.len())
+}
+
 fn main() -> Result<(), Box<dyn std::error::Error>> {
     let args: Vec<String> = env::args().collect();
-    if args.len() < 4 {
-        eprintln!("Usage: write_account <account_pubkey> <offset> <file> [--chunk-size N]");
+    if args.len() < 3 {
+        eprintln!("Usage: write_account <account_pubkey> <offset> <file|-> [--chunk-size N]");
+        eprintln!("       write_account <account_pubkey> --jobs [--chunk-size N]");
         return Ok(());
     }
 
     let mut positional = Vec::new();
     let mut chunk_size = DEFAULT_CHUNK_SIZE;
+    let mut jobs_mode = false;
     let mut i = 1;
     while i < args.len() {
         if args[i] == "--chunk-size" {
@@ -94,17 +171,20 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
             i += 2;
             continue;
         }
+        if args[i] == "--jobs" {
+            jobs_mode = true;
+            i += 1;
+            continue;
+        }
         positional.push(args[i].clone());
         i += 1;
     }
 
-    if positional.len() < 3 {
+    if positional.is_empty() || (!jobs_mode && positional.len() < 3) {
         return Err("Missing required arguments".into());
     }
 
     let target_pubkey = Pubkey::from_str(&positional[0])?;
-    let base_offset = parse_offset(&positional[1])?;
-    let file_path = &positional[2];
 
     let solana_config_path = env::var("SOLANA_CONFIG").unwrap_or_else(|_| DEFAULT_SOLANA_CONFIG.to_string());
     let cli_config = load_solana_cli_config(&solana_config_path);
@@ -123,47 +203,42 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     let client = RpcClient::new_with_commitment(rpc_url.clone(), CommitmentConfig::confirmed());
     let payer = solana_sdk::signature::read_keypair_file(&payer_keypair_path)?;
 
-    let data = fs::read(file_path)?;
+    if jobs_mode {
+        // One job per stdin line, answered with "ok <bytes>" or
+        // "err <message>" on stdout. Jobs run in arrival order; the process
+        // exits on EOF.
+        let mut stdout = std::io::stdout();
+        for line in std::io::stdin().lock().lines() {
+            let line = line?;
+            if line.trim().is_empty() {
+                continue;
+            }
+            match run_job(&line, &client, &payer, frostbite_id, target_pubkey, chunk_size) {
+                Ok(written) => writeln!(stdout, "ok {}", written)?,
+                Err(err) => writeln!(stdout, "err {}", err.to_string().replace('\n', " "))?,
+            }
+            stdout.flush()?;
+        }
+        return Ok(());
+    }
+
+    let base_offset = parse_offset(&positional[1])?;
+    let file_path = &positional[2];
+
+    let data = if file_path == "-" {
+        let mut buf = Vec::new();
+        std::io::stdin().read_to_end(&mut buf)?;
+        buf
+    } else {
+        fs::read(file_path)?
+    };
     let total = data.len();
     if total == 0 {
         eprintln!("No data to write");
         return Ok(());
     }
 
-    let mut offset = base_offset as usize;
-    let mut start = 0usize;
-    let mut _chunk_idx = 0u64;
-
-    while start < total {
-        let end = usize::min(start + chunk_size, total);
-        let chunk = &data[start..end];
-
-        let mut ix_data = Vec::with_capacity(1 + 4 + chunk.len());
-        ix_data.push(WRITE_ACCOUNT);
-        ix_data.extend_from_slice(&(offset as u32).to_le_bytes());
-        ix_data.extend_from_slice(chunk);
-
-        let ix = Instruction {
-            program_id: frostbite_id,
-            accounts: vec![
-                AccountMeta::new_readonly(payer.pubkey(), true),
-                AccountMeta::new(target_pubkey, false),
-            ],
-            data: ix_data,
-        };
-
-        let tx = Transaction::new_signed_with_payer(
-            &[ix],
-            Some(&payer.pubkey()),
-            &[&payer as &dyn Signer],
-            client.get_latest_blockhash()?,
-        );
-        client.send_and_confirm_transaction(&tx)?;
-
-        _chunk_idx += 1;
-        start = end;
-        offset += chunk.len();
-    }
+    write_payload(&client, &payer, frostbite_id, target_pubkey, base_offset, &data, chunk_size)?;
 
     println!("Wrote {} bytes to {}", total, target_pubkey);
     Ok(())
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import math
+import os
+import struct
+import sys
+import zipfile
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
+
+@functools.lru_cache(maxsize=1)
 def _require_numpy() -> Any:
     try:
         import numpy as np  # type: ignore
@@ -15,6 +27,7 @@ def _require_numpy() -> Any:
     return np
 
 
+@functools.lru_cache(maxsize=1)
 def _require_torch() -> Any:
     try:
         import torch  # type: ignore
@@ -23,6 +36,7 @@ def _require_torch() -> Any:
     return torch
 
 
+@functools.lru_cache(maxsize=1)
 def _require_sklearn() -> Any:
     try:
         import sklearn  # type: ignore
@@ -31,6 +45,12 @@ def _require_sklearn() -> Any:
     return sklearn
 
 
+def _dumps_json(payload: Any) -> bytes:
+    if orjson is None:
+        return json.dumps(payload, indent=2).encode("utf-8")
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+
+
 def _load_manifest(path: Path) -> Dict[str, Any]:
     from ..manifest import load_manifest
 
@@ -83,15 +103,22 @@ def _load_csv(path: Path, label_col: str | None) -> Tuple[Any, Any]:
         pd = None
 
     if pd is None:
-        data = np.genfromtxt(path, delimiter=",", dtype=np.float32)
+        data = np.loadtxt(path, delimiter=",", dtype=np.float32, ndmin=2)
         if data.ndim != 2 or data.shape[1] < 2:
             raise ValueError("CSV must have at least 2 columns")
         label_idx = -1 if label_col is None else int(label_col)
         x = np.delete(data, label_idx, axis=1)
-        y = data[:, label_idx]
+        y = np.ascontiguousarray(data[:, label_idx])
         return x, y
 
-    df = pd.read_csv(path)
+    try:
+        import pyarrow  # type: ignore  # noqa: F401
+    except ImportError:
+        engine = "c"
+    else:
+        engine = "pyarrow"
+
+    df = pd.read_csv(path, engine=engine)
     if df.empty:
         raise ValueError("CSV is empty")
     if label_col is None:
@@ -101,25 +128,86 @@ def _load_csv(path: Path, label_col: str | None) -> Tuple[Any, Any]:
         features = df.drop(columns=[label_col])
     except KeyError as exc:
         raise ValueError(f"label column not found: {label_col}") from exc
-    return features.to_numpy(dtype="float32"), label_series.to_numpy()
+    return features.to_numpy(dtype="float32", copy=False), label_series.to_numpy()
+
+
+_ZIP_LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+_ZIP64_EXTRA_ID = 0x0001
+
+
+def _zip64_extra_sizes(extra: bytes) -> Tuple[int, ...] | None:
+    """Values of the zip64 extra field in a local header, or None if absent."""
+    pos = 0
+    while pos + 4 <= len(extra):
+        tag, size = struct.unpack_from("<HH", extra, pos)
+        if tag == _ZIP64_EXTRA_ID:
+            body = extra[pos + 4 : pos + 4 + size]
+            return struct.unpack_from(f"<{len(body) // 8}Q", body)
+        pos += 4 + size
+    return None
+
+
+def _npz_member(data: Any, path: Path, key: str) -> Any:
+    """Memory-map an uncompressed npz member; anything else goes through np.load.
+
+    The member is mapped only when its local header is stored (method 0) and
+    any zip64 extra field agrees with the central directory sizes, so the
+    array bytes are known to sit verbatim at the computed offset.
+    ``np.savez`` always writes a zip64 extra, so its presence alone is not a
+    reason to fall back.
+    """
+    np = _require_numpy()
+    try:
+        info = data.zip.getinfo(f"{key}.npy")
+    except KeyError:
+        return data[key]
+    if info.compress_type != zipfile.ZIP_STORED:
+        return data[key]
+    with path.open("rb") as handle:
+        handle.seek(info.header_offset)
+        local_header = handle.read(30)
+        if len(local_header) < 30 or local_header[:4] != _ZIP_LOCAL_HEADER_MAGIC:
+            return data[key]
+        (method,) = struct.unpack("<H", local_header[8:10])
+        name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+        if method != zipfile.ZIP_STORED:
+            return data[key]
+        handle.seek(name_len, os.SEEK_CUR)
+        zip64_sizes = _zip64_extra_sizes(handle.read(extra_len))
+        if zip64_sizes is not None and any(size != info.file_size for size in zip64_sizes[:2]):
+            return data[key]
+        data_start = handle.tell()
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+        else:
+            return data[key]
+        offset = handle.tell()
+    if dtype.hasobject:
+        return data[key]
+    if offset - data_start + math.prod(shape) * dtype.itemsize > info.file_size:
+        return data[key]
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape, order="F" if fortran_order else "C", offset=offset)
 
 
 def _load_npz(path: Path, template: str) -> Dict[str, Any]:
     np = _require_numpy()
-    data = np.load(path)
     payload: Dict[str, Any] = {}
 
-    if template == "two_tower":
-        if "x_a" not in data or "x_b" not in data:
-            raise ValueError("npz for two_tower must include x_a and x_b")
-        payload["x_a"] = data["x_a"]
-        payload["x_b"] = data["x_b"]
-        payload["y"] = data["y"] if "y" in data else None
-    else:
-        if "x" not in data:
-            raise ValueError("npz must include x array")
-        payload["x"] = data["x"]
-        payload["y"] = data["y"] if "y" in data else None
+    with np.load(path) as data:
+        if template == "two_tower":
+            if "x_a" not in data or "x_b" not in data:
+                raise ValueError("npz for two_tower must include x_a and x_b")
+            payload["x_a"] = _npz_member(data, path, "x_a")
+            payload["x_b"] = _npz_member(data, path, "x_b")
+            payload["y"] = _npz_member(data, path, "y") if "y" in data else None
+        else:
+            if "x" not in data:
+                raise ValueError("npz must include x array")
+            payload["x"] = _npz_member(data, path, "x")
+            payload["y"] = _npz_member(data, path, "y") if "y" in data else None
     return payload
 
 
@@ -132,34 +220,89 @@ def _load_dataset(path: Path, template: str, label_col: str | None) -> Dict[str,
     raise ValueError("Unsupported dataset format (use .csv or .npz)")
 
 
-def _split_indices(n: int, val_split: float, seed: int) -> Tuple[Any, Any]:
+def _split_indices(n: int, val_split: float, seed: int) -> Tuple[Any, int]:
     np = _require_numpy()
-    idx = np.arange(n)
     rng = np.random.default_rng(seed)
-    rng.shuffle(idx)
+    perm = rng.permutation(n)
     val_size = int(round(n * val_split))
-    val_idx = idx[:val_size]
-    train_idx = idx[val_size:]
-    return train_idx, val_idx
+    return perm, val_size
+
+
+def _permuted_split(arr: Any, perm: Any, val_size: int) -> Tuple[Any, Any]:
+    # One gather into shuffled order; train/val are then slice views of it.
+    np = _require_numpy()
+    shuffled = np.take(arr, perm, axis=0)
+    return shuffled[val_size:], shuffled[:val_size]
 
 
 def _train_val_split(x: Any, y: Any, val_split: float, seed: int) -> Tuple[Any, Any, Any, Any]:
     if y is None:
         raise ValueError("dataset must include labels (y)")
-    train_idx, val_idx = _split_indices(len(x), val_split, seed)
-    return x[train_idx], y[train_idx], x[val_idx], y[val_idx]
-    return x[train_idx], y[train_idx], x[val_idx], y[val_idx]
+    perm, val_size = _split_indices(len(x), val_split, seed)
+    x_train, x_val = _permuted_split(x, perm, val_size)
+    y_train, y_val = _permuted_split(y, perm, val_size)
+    return x_train, y_train, x_val, y_val
+
+
+def _abs_percentile(flat: Any, percentile: float) -> float:
+    """Linear-interpolated percentile of |flat| via in-place quickselect (numba kernel)."""
+    n = flat.shape[0]
+    for i in range(n):
+        flat[i] = abs(flat[i])
+    pos = (n - 1) * percentile / 100.0
+    k = int(pos)
+    lo = 0
+    hi = n - 1
+    while lo < hi:
+        pivot = flat[(lo + hi) // 2]
+        i = lo
+        j = hi
+        while i <= j:
+            while flat[i] < pivot:
+                i += 1
+            while flat[j] > pivot:
+                j -= 1
+            if i <= j:
+                flat[i], flat[j] = flat[j], flat[i]
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+    value = flat[k]
+    if k + 1 < n:
+        upper = flat[k + 1]
+        for idx in range(k + 2, n):
+            if flat[idx] < upper:
+                upper = flat[idx]
+        value += (pos - k) * (upper - value)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _abs_percentile_kernel() -> Any:
+    try:
+        import numba  # type: ignore
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_abs_percentile)
 
 
 def _compute_scale_q16(values: Any, percentile: float | None) -> int:
     np = _require_numpy()
-    flat = np.abs(np.asarray(values).reshape(-1))
-    if flat.size == 0:
+    arr = np.asarray(values).reshape(-1)
+    if arr.size == 0:
         return 1 << 16
-    if percentile is not None:
-        max_abs = float(np.percentile(flat, percentile))
+    kernel = _abs_percentile_kernel() if percentile is not None else None
+    if kernel is not None:
+        max_abs = float(kernel(np.array(arr, dtype=np.float64), float(percentile)))
+    elif percentile is not None:
+        max_abs = float(np.percentile(np.abs(arr), percentile))
     else:
-        max_abs = float(flat.max())
+        max_abs = float(np.abs(arr).max())
     if max_abs == 0:
         return 1 << 16
     scale_real = max_abs / 127.0
@@ -178,37 +321,96 @@ def _write_calibration(path: Path, values: Any, percentile: float) -> None:
         "clip_abs": clip,
         "q16_scale": 1 << 16,
     }
-    path.write_text(json.dumps(payload, indent=2))
+    path.write_bytes(_dumps_json(payload))
 
 
 def _as_torch(x: Any, torch: Any) -> Any:
-    return torch.tensor(x, dtype=torch.float32)
+    np = _require_numpy()
+    return torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32))
+
+
+def _train_device(torch: Any) -> str:
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _make_loader(ds: Any, batch_size: int, shuffle: bool, device: str, torch: Any) -> Any:
+    # Pinned host memory + background workers only pay off when batches cross to a GPU.
+    cuda = device == "cuda"
+    num_workers = min(4, os.cpu_count() or 1) if cuda else 0
+    return torch.utils.data.DataLoader(
+        ds,
+        batch_size=batch_size,
+        shuffle=shuffle,
+        pin_memory=cuda,
+        num_workers=num_workers,
+        persistent_workers=num_workers > 0,
+        prefetch_factor=2 if num_workers > 0 else None,
+        drop_last=False,
+    )
+
+
+class _ResidentLoader:
+    """Shuffled mini-batches over tensors that already live on the training device."""
+
+    def __init__(self, tensors: Tuple[Any, ...], batch_size: int, torch: Any) -> None:
+        self._tensors = tensors
+        self._batch_size = batch_size
+        self._torch = torch
+
+    def __iter__(self) -> Any:
+        first = self._tensors[0]
+        perm = self._torch.randperm(first.shape[0], device=first.device)
+        for start in range(0, first.shape[0], self._batch_size):
+            idx = perm[start : start + self._batch_size]
+            yield tuple(t[idx] for t in self._tensors)
+
+
+def _train_loader(tensors: Tuple[Any, ...], batch_size: int, device: str, torch: Any) -> Any:
+    # Datasets that fit comfortably in free GPU memory are copied once up front,
+    # which removes the per-batch host->device transfer for every epoch.
+    if device == "cuda":
+        nbytes = sum(t.numel() * t.element_size() for t in tensors)
+        free_bytes, _ = torch.cuda.mem_get_info()
+        if nbytes < free_bytes * 0.5:
+            resident = tuple(t.to(device, non_blocking=True) for t in tensors)
+            return _ResidentLoader(resident, batch_size, torch)
+    return _make_loader(torch.utils.data.TensorDataset(*tensors), batch_size, True, device, torch)
+
+
+def _make_optimizer(model: Any, lr: float, device: str, torch: Any) -> Any:
+    # fused and foreach are mutually exclusive; older torch builds accept neither.
+    kernel = {"fused": True} if device == "cuda" else {"foreach": True}
+    try:
+        return torch.optim.Adam(model.parameters(), lr=lr, **kernel)
+    except TypeError:
+        return torch.optim.Adam(model.parameters(), lr=lr)
 
 
-def _train_loop(model: Any, loader: Any, loss_fn: Any, optimizer: Any, device: str, epochs: int) -> None:
-    torch = _require_torch()
+def _train_loop(model: Any, loader: Any, loss_fn: Any, optimizer: Any, device: str, epochs: int, torch: Any) -> None:
+    # bf16 autocast only on GPUs that support it; on CPU it is slower unless AMX is present.
+    use_autocast = device == "cuda" and torch.cuda.is_bf16_supported()
     model.train()
     for _ in range(epochs):
         for batch in loader:
             optimizer.zero_grad(set_to_none=True)
-            if isinstance(batch, (list, tuple)) and len(batch) == 3:
-                xa, xb, y = batch
-                pred = model(xa.to(device), xb.to(device))
-                loss = loss_fn(pred, y.to(device))
-            else:
-                x, y = batch
-                pred = model(x.to(device))
-                loss = loss_fn(pred, y.to(device))
+            with torch.autocast(device_type=device, dtype=torch.bfloat16, enabled=use_autocast):
+                if isinstance(batch, (list, tuple)) and len(batch) == 3:
+                    xa, xb, y = batch
+                    pred = model(xa.to(device, non_blocking=True), xb.to(device, non_blocking=True))
+                    loss = loss_fn(pred, y.to(device, non_blocking=True))
+                else:
+                    x, y = batch
+                    pred = model(x.to(device, non_blocking=True))
+                    loss = loss_fn(pred, y.to(device, non_blocking=True))
             loss.backward()
             optimizer.step()
 
 
 def _prepare_labels(y: Any, task: str, output_dim: int, torch: Any) -> Any:
-    if task == "classification":
-        if output_dim == 1:
-            return torch.tensor(y, dtype=torch.float32).view(-1, 1)
-        return torch.tensor(y, dtype=torch.long)
-    return torch.tensor(y, dtype=torch.float32).view(-1, output_dim)
+    np = _require_numpy()
+    class_indices = task == "classification" and output_dim > 1
+    labels = torch.from_numpy(np.ascontiguousarray(y, dtype=np.int64 if class_indices else np.float32))
+    return labels if class_indices else labels.view(-1, output_dim)
 
 
 def _loss_fn(task: str, output_dim: int, torch: Any) -> Any:
@@ -259,12 +461,12 @@ def _tiny_cnn_model(input_height: int, input_width: int, kernel_size: int, strid
             self.fc = torch.nn.Linear(out_channels, output_dim, bias=has_bias)
 
         def forward(self, x: Any) -> Any:
-            x = x.view(-1, 1, input_height, input_width)
+            x = x.view(-1, 1, input_height, input_width).contiguous(memory_format=torch.channels_last)
             y = torch.relu(self.conv(x))
             y = y.mean(dim=(2, 3))
             return self.fc(y)
 
-    return Model()
+    return Model().to(memory_format=torch.channels_last)
 
 
 def _two_tower_model(input_dim_a: int, input_dim_b: int, embed_dim: int, torch: Any, has_bias: bool) -> Any:
@@ -277,11 +479,64 @@ def _two_tower_model(input_dim_a: int, input_dim_b: int, embed_dim: int, torch:
         def forward(self, xa: Any, xb: Any) -> Any:
             ea = self.tower_a(xa)
             eb = self.tower_b(xb)
-            return (ea * eb).sum(dim=1, keepdim=True)
+            return torch.einsum("bd,bd->b", ea, eb).unsqueeze(1)
 
     return Model()
 
 
+class _CompiledModel:
+    """Run a ``torch.compile`` module, falling back to its eager module.
+
+    Batches whose size differs from the first one (the short final batch) run
+    eagerly rather than forcing a recompile under ``dynamic=False``, and a
+    compiler/backend failure switches the rest of training to eager mode.
+    """
+
+    def __init__(self, compiled: Any, eager: Any, compile_errors: Tuple[type, ...]) -> None:
+        self._compiled = compiled
+        self._eager = eager
+        self._compile_errors = compile_errors
+        self._batch_size: int | None = None
+
+    def train(self, mode: bool = True) -> "_CompiledModel":
+        self._eager.train(mode)
+        return self
+
+    def __call__(self, *inputs: Any) -> Any:
+        if self._compiled is not None:
+            batch_size = inputs[0].shape[0]
+            if self._batch_size is None:
+                self._batch_size = batch_size
+            if batch_size == self._batch_size:
+                try:
+                    return self._compiled(*inputs)
+                except self._compile_errors as exc:
+                    print(f"torch.compile failed, training eagerly: {exc}", file=sys.stderr)
+                    self._compiled = None
+        return self._eager(*inputs)
+
+
+def _maybe_compile(model: Any, torch: Any, device: str) -> Any:
+    # The compiled wrapper shares parameters with `model`, so weights are still
+    # extracted from the eager module (its state_dict keys stay unprefixed).
+    # Compiling only pays off on GPUs by default; CAULDRON_COMPILE=1 forces it
+    # on CPU and CAULDRON_COMPILE=0 disables it.
+    setting = os.environ.get("CAULDRON_COMPILE", "1" if device == "cuda" else "0")
+    if setting != "1" or not hasattr(torch, "compile"):
+        return model
+    try:
+        from torch._dynamo.exc import TorchDynamoException  # type: ignore
+    except ImportError:
+        return model
+    mode = os.environ.get("CAULDRON_COMPILE_MODE", "reduce-overhead")
+    try:
+        compiled = torch.compile(model, mode=mode, dynamic=False)
+    except (RuntimeError, TorchDynamoException) as exc:
+        print(f"torch.compile unavailable, training eagerly: {exc}", file=sys.stderr)
+        return model
+    return _CompiledModel(compiled, model, (TorchDynamoException,))
+
+
 def _extract_weights(model: Any, template: str, has_bias: bool) -> Dict[str, Any]:
     torch = _require_torch()
     state = {k: v.detach().cpu().numpy() for k, v in model.state_dict().items()}
@@ -387,6 +642,10 @@ def _train_torch(
     np = _require_numpy()
     torch = _require_torch()
     torch.manual_seed(seed)
+    device = _train_device(torch)
+    if device == "cuda":
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
 
     has_bias = not overrides.get("no_bias", False)
 
@@ -408,17 +667,20 @@ def _train_torch(
         if not isinstance(embed_dim, int):
             raise ValueError("build.embed_dim required")
         model = _two_tower_model(input_dim_a, input_dim_b, embed_dim, torch, has_bias)
-        train_idx, val_idx = _split_indices(len(xa), val_split, seed)
-        xa_train, xa_val = xa[train_idx], xa[val_idx]
-        xb_train, xb_val = xb[train_idx], xb[val_idx]
-        y_train, y_val = y[train_idx], y[val_idx]
-        train_ds = torch.utils.data.TensorDataset(
-            _as_torch(xa_train, torch), _as_torch(xb_train, torch), _prepare_labels(y_train, task, 1, torch)
+        perm, val_size = _split_indices(len(xa), val_split, seed)
+        xa_train, xa_val = _permuted_split(xa, perm, val_size)
+        xb_train, xb_val = _permuted_split(xb, perm, val_size)
+        y_train, y_val = _permuted_split(y, perm, val_size)
+        loader = _train_loader(
+            (_as_torch(xa_train, torch), _as_torch(xb_train, torch), _prepare_labels(y_train, task, 1, torch)),
+            batch_size,
+            device,
+            torch,
         )
-        loader = torch.utils.data.DataLoader(train_ds, batch_size=batch_size, shuffle=True)
+        model = model.to(device)
         loss_fn = _loss_fn(task, 1, torch)
-        optimizer = torch.optim.Adam(model.parameters(), lr=lr)
-        _train_loop(model, loader, loss_fn, optimizer, "cpu", epochs)
+        optimizer = _make_optimizer(model, lr, device, torch)
+        _train_loop(model, loader, loss_fn, optimizer, device, epochs, torch)
         return _extract_weights(model, template, has_bias)
 
     x = np.asarray(data["x"], dtype=np.float32)
@@ -511,11 +773,12 @@ def _train_torch(
     x_train, y_train, _, _ = _train_val_split(x, y, val_split, seed)
     x_train_t = _as_torch(x_train, torch)
     y_train_t = _prepare_labels(y_train, task, output_dim, torch)
-    train_ds = torch.utils.data.TensorDataset(x_train_t, y_train_t)
-    loader = torch.utils.data.DataLoader(train_ds, batch_size=batch_size, shuffle=True)
+    loader = _train_loader((x_train_t, y_train_t), batch_size, device, torch)
+    model = model.to(device)
+    train_model = _maybe_compile(model, torch, device) if template in ("cnn1d", "tiny_cnn") else model
     loss_fn = _loss_fn(task, output_dim, torch)
-    optimizer = torch.optim.Adam(model.parameters(), lr=lr)
-    _train_loop(model, loader, loss_fn, optimizer, "cpu", epochs)
+    optimizer = _make_optimizer(model, lr, device, torch)
+    _train_loop(train_model, loader, loss_fn, optimizer, device, epochs, torch)
     return _extract_weights(model, template, has_bias)
 
 
@@ -560,25 +823,29 @@ def _train_tree(manifest: Dict[str, Any], data: Dict[str, Any], max_depth: int |
     model = DecisionTreeRegressor(max_depth=max_depth)
     model.fit(x, y)
     tree = model.tree_
-    nodes = []
-    for idx in range(tree.node_count):
-        feature = int(tree.feature[idx])
-        if feature < 0:
-            nodes.append({"feature": -1, "threshold": 0.0, "left": -1, "right": -1, "value": float(tree.value[idx][0][0])})
-        else:
-            nodes.append(
-                {
-                    "feature": feature,
-                    "threshold": float(tree.threshold[idx]),
-                    "left": int(tree.children_left[idx]),
-                    "right": int(tree.children_right[idx]),
-                    "value": float(tree.value[idx][0][0]),
-                }
-            )
-    if len(nodes) > node_count:
+    if tree.node_count > node_count:
         raise ValueError("trained tree exceeds build.tree_node_count")
-    while len(nodes) < node_count:
-        nodes.append({"feature": -1, "threshold": 0.0, "left": -1, "right": -1, "value": 0.0})
+    feature = tree.feature.astype(np.int64).tolist()
+    threshold = tree.threshold.astype(np.float64).tolist()
+    left = tree.children_left.astype(np.int64).tolist()
+    right = tree.children_right.astype(np.int64).tolist()
+    value = tree.value[:, 0, 0].astype(np.float64).tolist()
+    nodes = [
+        {"feature": -1, "threshold": 0.0, "left": -1, "right": -1, "value": value[idx]}
+        if feature[idx] < 0
+        else {
+            "feature": feature[idx],
+            "threshold": threshold[idx],
+            "left": left[idx],
+            "right": right[idx],
+            "value": value[idx],
+        }
+        for idx in range(tree.node_count)
+    ]
+    nodes.extend(
+        {"feature": -1, "threshold": 0.0, "left": -1, "right": -1, "value": 0.0}
+        for _ in range(node_count - len(nodes))
+    )
     return {"nodes": nodes}
 
 
@@ -631,7 +898,7 @@ def run_train_from_args(args: Any) -> int:
     out_dir = Path(args.output_dir) if args.output_dir else manifest_path.parent
     out_dir.mkdir(parents=True, exist_ok=True)
     weights_path = out_dir / "weights.json"
-    weights_path.write_text(json.dumps(weights, indent=2))
+    weights_path.write_bytes(_dumps_json(weights))
 
     if args.input_calibrate_percentile is not None:
         if "x" in data:
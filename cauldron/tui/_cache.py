@@ -0,0 +1,161 @@
+"""Stat-keyed caches for manifest and accounts parsing used by TUI commands.
+
+Entries are keyed by the resolved path plus ``st_mtime_ns`` and ``st_size``,
+so an edited file is re-parsed on the next call while unchanged files cost a
+single ``stat()``.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import os
+from pathlib import Path
+from typing import Any
+
+from ..accounts import load_accounts
+from ..helpers import accounts_segment_metas, resolve_accounts_path
+from ..manifest import load_manifest
+from ..validate import validate_manifest
+
+
+def _stat_key(path: str | Path) -> tuple[str, int, int] | None:
+    try:
+        resolved = Path(path).resolve()
+        st = os.stat(resolved)
+    except OSError:
+        return None
+    return str(resolved), st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_load_manifest(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return load_manifest(path_str)
+
+
+def _keypair_candidates(accounts_path: str, accounts: dict[str, Any]) -> list[str]:
+    cluster = accounts.get("cluster") if isinstance(accounts.get("cluster"), dict) else {}
+    vm = accounts.get("vm") if isinstance(accounts.get("vm"), dict) else {}
+    raw = [cluster.get("payer"), vm.get("authority_keypair"), vm.get("keypair")]
+    segments = accounts.get("segments")
+    if isinstance(segments, list):
+        raw.extend(seg.get("keypair") for seg in segments if isinstance(seg, dict))
+    paths: list[str] = []
+    for value in raw:
+        if isinstance(value, str) and value:
+            # Some readers resolve against the accounts file, others against
+            # the working directory; watch both.
+            paths.append(resolve_accounts_path(accounts_path, value))
+            paths.append(str(Path(value).expanduser()))
+    return paths
+
+
+def keypair_stat_keys(
+    accounts_path: str | Path,
+    payer_override: str | None = None,
+) -> tuple[tuple[str, int, int] | None, ...]:
+    """Stat keys of every keypair file the accounts metadata may read.
+
+    ``accounts_segment_metas`` derives pubkeys from the payer, authority and
+    segment keypairs, so caches of its results must be invalidated when any
+    of those files change, not only the accounts file itself.
+    """
+    key = _stat_key(accounts_path)
+    paths = [payer_override] if payer_override else []
+    if key is not None:
+        try:
+            paths.extend(_keypair_candidates(key[0], _cached_load_accounts(*key)))
+        except Exception:
+            pass
+    return tuple(_stat_key(path) for path in paths)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_accounts_segment_metas(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    program_id: str | None,
+    payer: str | None,
+    keypairs: tuple[tuple[str, int, int] | None, ...],
+) -> tuple[dict[str, str | None], list[str]]:
+    return accounts_segment_metas(
+        path_str,
+        program_id_override=program_id,
+        payer_override=payer,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_load_accounts(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    return load_accounts(path_str)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_validate(path_str: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    return tuple(validate_manifest(_cached_load_manifest(path_str, mtime_ns, size)))
+
+
+def cached_load_manifest(path: str | Path, *, readonly: bool = False) -> dict[str, Any]:
+    """``load_manifest`` backed by the stat-keyed cache.
+
+    Returns a deep copy so callers may mutate the result freely, unless
+    ``readonly`` is set, in which case the shared cached dict is returned and
+    must not be modified.
+    """
+    key = _stat_key(path)
+    if key is None:
+        return load_manifest(path)
+    manifest = _cached_load_manifest(*key)
+    return manifest if readonly else copy.deepcopy(manifest)
+
+
+def cached_load_accounts(path: str | Path, *, readonly: bool = False) -> dict[str, Any]:
+    """``load_accounts`` backed by the stat-keyed cache; see :func:`cached_load_manifest`."""
+    key = _stat_key(path)
+    if key is None:
+        return load_accounts(path)
+    accounts = _cached_load_accounts(*key)
+    return accounts if readonly else copy.deepcopy(accounts)
+
+
+def cached_accounts_segment_metas(
+    accounts_path: str | Path,
+    *,
+    program_id_override: str | None = None,
+    payer_override: str | None = None,
+) -> tuple[dict[str, str | None], list[str]]:
+    """``accounts_segment_metas`` backed by the stat-keyed cache.
+
+    The key also covers the keypair files it reads; see :func:`keypair_stat_keys`.
+    """
+    key = _stat_key(accounts_path)
+    if key is None:
+        return accounts_segment_metas(
+            str(accounts_path),
+            program_id_override=program_id_override,
+            payer_override=payer_override,
+        )
+    info, mapped = _cached_accounts_segment_metas(
+        *key,
+        program_id_override,
+        payer_override,
+        keypair_stat_keys(accounts_path, payer_override),
+    )
+    return dict(info), list(mapped)
+
+
+def cached_validate_manifest(path: str | Path) -> list[str]:
+    """Load and validate a manifest, reusing the result while the file is unchanged."""
+    key = _stat_key(path)
+    if key is None:
+        return validate_manifest(load_manifest(path))
+    return list(_cached_validate(*key))
+
+
+def clear_caches() -> None:
+    """Drop every cached manifest, validation and accounts result."""
+    _cached_load_manifest.cache_clear()
+    _cached_load_accounts.cache_clear()
+    _cached_validate.cache_clear()
+    _cached_accounts_segment_metas.cache_clear()
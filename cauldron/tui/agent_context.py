@@ -2,28 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import json
-import platform
+import os
 import shutil
 import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 from .state import ProjectInfo
 
 
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+_STAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
 def _iso_now() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return datetime.now(timezone.utc).strftime(_ISO_FORMAT)
+
+
+def context_stamps() -> tuple[str, str]:
+    """Return `(iso, filename_stamp)` UTC strings from a single clock read."""
+    now = datetime.now(timezone.utc)
+    return now.strftime(_ISO_FORMAT), now.strftime(_STAMP_FORMAT)
+
+
+_SUGGESTED_CHECKS = (
+    "\n## Suggested Checks\n"
+    "- Verify manifest/accounts paths above exist and are current.\n"
+    "- Re-run the most recent failed wizard step first if `last_error` is present.\n"
+    "- Use this context as the opening prompt payload for your coding agent.\n"
+)
+
+
+def _dumps_output(data: dict[str, Any]) -> str:
+    if orjson is None:
+        return json.dumps(data, indent=2, sort_keys=True)
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+    except TypeError:
+        # orjson rejects non-str keys and some types stdlib json accepts.
+        return json.dumps(data, indent=2, sort_keys=True)
 
 
 def _status_lines(step_states: dict[int, str] | None) -> list[str]:
     if not step_states:
         return []
-    lines: list[str] = []
-    for step_idx in sorted(step_states):
-        lines.append(f"- step_{step_idx}: {step_states[step_idx]}")
-    return lines
+    return [f"- step_{step_idx}: {state}" for step_idx, state in sorted(step_states.items())]
 
 
 def render_agent_context(
@@ -39,98 +73,165 @@ def render_agent_context(
     last_error: str | None = None,
     invoke_signature: str | None = None,
     output_data: dict[str, Any] | None = None,
+    now_iso: str | None = None,
 ) -> str:
     """Render a markdown context bundle for coding-agent handoff."""
-    lines: list[str] = []
-    lines.append("# Cauldron TUI Context")
-    lines.append("")
-    lines.append(f"- generated_utc: {_iso_now()}")
-    lines.append(f"- source: {source}")
-    lines.append(f"- project_name: {project.name}")
-    lines.append(f"- project_path: {project.path}")
-    lines.append(f"- manifest_path: {project.manifest_path}")
-    lines.append(f"- accounts_path: {project.accounts_path if project.accounts_path else '(none)'}")
-    lines.append(f"- cluster: {project.cluster or 'devnet'}")
-    lines.append(f"- rpc_url: {project.rpc_url or '(from accounts/solana config)'}")
-    lines.append(f"- program_id: {project.program_id or '(from accounts/solana config)'}")
-    lines.append(f"- payer: {project.payer or '(from accounts/solana config)'}")
-    if current_panel:
-        lines.append(f"- current_panel: {current_panel}")
-    if workflow_mode:
-        lines.append(f"- workflow_mode: {workflow_mode}")
-    if step_index is not None:
-        lines.append(f"- wizard_step_index: {step_index}")
-    if step_name:
-        lines.append(f"- wizard_step_name: {step_name}")
-    if invoke_signature:
-        lines.append(f"- invoke_signature: {invoke_signature}")
-    if last_error:
-        lines.append(f"- last_error: {last_error}")
+    fields = (
+        ("generated_utc", now_iso or _iso_now()),
+        ("source", source),
+        ("project_name", project.name),
+        ("project_path", project.path),
+        ("manifest_path", project.manifest_path),
+        ("accounts_path", project.accounts_path if project.accounts_path else "(none)"),
+        ("cluster", project.cluster or "devnet"),
+        ("rpc_url", project.rpc_url or "(from accounts/solana config)"),
+        ("program_id", project.program_id or "(from accounts/solana config)"),
+        ("payer", project.payer or "(from accounts/solana config)"),
+        ("current_panel", current_panel),
+        ("workflow_mode", workflow_mode),
+        ("wizard_step_index", step_index),
+        ("wizard_step_name", step_name),
+        ("invoke_signature", invoke_signature),
+        ("last_error", last_error),
+    )
+    buf = io.StringIO()
+    buf.write("# Cauldron TUI Context\n\n")
+    buf.writelines(f"- {key}: {value}\n" for key, value in fields if value not in (None, ""))
 
     status = _status_lines(step_states)
     if status:
-        lines.append("")
-        lines.append("## Wizard Step Status")
-        lines.extend(status)
+        buf.write("\n## Wizard Step Status\n")
+        buf.writelines(f"{line}\n" for line in status)
 
     if output_data:
-        lines.append("")
-        lines.append("## Latest Output")
-        lines.append("```json")
-        lines.append(json.dumps(output_data, indent=2, sort_keys=True))
-        lines.append("```")
+        buf.write("\n## Latest Output\n```json\n")
+        buf.write(_dumps_output(output_data))
+        buf.write("\n```\n")
 
     if logs:
-        lines.append("")
-        lines.append("## Recent Logs")
-        lines.append("```text")
-        for entry in logs[-80:]:
-            lines.append(entry)
-        lines.append("```")
-
-    lines.append("")
-    lines.append("## Suggested Checks")
-    lines.append("- Verify manifest/accounts paths above exist and are current.")
-    lines.append("- Re-run the most recent failed wizard step first if `last_error` is present.")
-    lines.append("- Use this context as the opening prompt payload for your coding agent.")
-    lines.append("")
-    return "\n".join(lines)
-
-
-def write_agent_context(project_path: Path, context_text: str) -> Path:
+        buf.write("\n## Recent Logs\n```text\n")
+        buf.writelines(f"{entry}\n" for entry in logs[-80:])
+        buf.write("```\n")
+
+    buf.write(_SUGGESTED_CHECKS)
+    return buf.getvalue()
+
+
+_CONTEXT_KEEP = 50
+
+
+def _prune_context_dir(out_dir: Path, keep: int) -> None:
+    """Delete all but the `keep` newest agent-context files (names sort by timestamp)."""
+    try:
+        bundles = sorted(out_dir.glob("agent-context-*.md"), key=lambda p: p.name, reverse=True)
+    except OSError:
+        return
+    for stale in bundles[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def write_agent_context(project: ProjectInfo, context_text: str, *, stamp: str | None = None) -> Path:
     """Write context markdown under project-local `.cauldron/context/`."""
-    out_dir = project_path / ".cauldron" / "context"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    out_dir = project.context_dir
+    if not project._ctx_dir_ready:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        project._ctx_dir_ready = True
+    if stamp is None:
+        stamp = datetime.now(timezone.utc).strftime(_STAMP_FORMAT)
     out_path = out_dir / f"agent-context-{stamp}.md"
-    out_path.write_text(context_text)
+    tmp_path = out_dir / f"agent-context-{stamp}.md.tmp"
+    try:
+        handle = open(tmp_path, "wb", buffering=0)
+    except FileNotFoundError:
+        # Directory was removed since it was last created for this project.
+        out_dir.mkdir(parents=True, exist_ok=True)
+        handle = open(tmp_path, "wb", buffering=0)
+    with handle:
+        handle.write(context_text.encode("utf-8"))
+    os.replace(tmp_path, out_path)
+    try:
+        asyncio.get_running_loop().run_in_executor(None, _prune_context_dir, out_dir, _CONTEXT_KEEP)
+    except RuntimeError:
+        _prune_context_dir(out_dir, _CONTEXT_KEEP)
     return out_path
 
 
-def copy_text_to_clipboard(text: str) -> tuple[bool, str]:
-    """Best-effort clipboard copy across common platforms."""
-    system = platform.system().lower()
-    candidates: list[list[str]] = []
-    if system == "darwin":
-        candidates.append(["pbcopy"])
-    elif system == "windows":
-        candidates.append(["clip"])
+@functools.lru_cache(maxsize=1)
+def _clipboard_commands() -> tuple[tuple[str, ...], ...]:
+    """Clipboard commands present on PATH, in preference order (resolved once per process)."""
+    if sys.platform == "darwin":
+        candidates: tuple[tuple[str, ...], ...] = (("pbcopy",),)
+    elif sys.platform == "win32":
+        candidates = (("clip",),)
     else:
-        candidates.extend(
-            [
-                ["wl-copy"],
-                ["xclip", "-selection", "clipboard"],
-                ["xsel", "--clipboard", "--input"],
-            ]
+        candidates = (
+            ("wl-copy",),
+            ("xclip", "-selection", "clipboard"),
+            ("xsel", "--clipboard", "--input"),
         )
+    return tuple(cmd for cmd in candidates if shutil.which(cmd[0]) is not None)
+
+
+def _windows_clipboard(text: str) -> bool:
+    """Set CF_UNICODETEXT through user32 directly, avoiding a `clip` subprocess."""
+    import ctypes
+    from ctypes import wintypes
+
+    gmem_moveable = 0x0002
+    cf_unicodetext = 13
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)  # type: ignore[attr-defined]
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    user32.OpenClipboard.argtypes = (wintypes.HWND,)
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(gmem_moveable, len(data))
+        if not handle:
+            return False
+        ptr = kernel32.GlobalLock(handle)
+        if not ptr:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(ptr, data, len(data))
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(cf_unicodetext, handle):
+            kernel32.GlobalFree(handle)
+            return False
+        # On success the clipboard owns `handle`; it must not be freed here.
+        return True
+    finally:
+        user32.CloseClipboard()
 
-    for cmd in candidates:
-        exe = cmd[0]
-        if shutil.which(exe) is None:
-            continue
+
+def copy_text_to_clipboard(text: str) -> tuple[bool, str]:
+    """Best-effort clipboard copy across common platforms."""
+    if sys.platform == "win32":
+        try:
+            if _windows_clipboard(text):
+                return True, "user32"
+        except Exception:
+            pass
+
+    data = text.encode("utf-8")
+    for cmd in _clipboard_commands():
         try:
-            subprocess.run(cmd, input=text, text=True, check=True, capture_output=True)
-            return True, exe
+            subprocess.run(cmd, input=data, check=True, capture_output=True)
+            return True, cmd[0]
         except Exception:
             continue
     return False, "no supported clipboard command found"
@@ -2,51 +2,152 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import Any, Callable, Final, NamedTuple
 
 from textual.app import App
 from textual.binding import Binding
 from textual.command import Hit, Hits, Provider
 
-from .state import AppState
+from .state import AppState, ProjectInfo
 from .runtime import resolve_runtime_context
 
 
+_MSG_NO_PROJECT: Final = "No active project"
+_MSG_NO_ACCOUNTS: Final = "No accounts file found"
+
+_COMMANDS: tuple[tuple[str, str], ...] = (
+    ("Initialize Project", "cmd_initialize_project"),
+    ("Validate Manifest", "cmd_validate"),
+    ("Show Manifest", "cmd_show"),
+    ("Pack Manifest", "cmd_pack"),
+    ("Build Guest", "cmd_build_guest"),
+    ("Schema Hash", "cmd_schema_hash"),
+    ("Chunk Weights", "cmd_chunk"),
+    ("Show Accounts", "cmd_accounts_show"),
+    ("Init Accounts", "cmd_accounts_init"),
+    ("Read Output", "cmd_output"),
+    ("New Project", "action_new_project"),
+    ("Go Home", "action_home"),
+    ("Settings", "action_settings"),
+    ("Wizard Mode", "action_wizard"),
+    ("Copy Agent Context", "action_copy_context"),
+    ("Quit Cauldron", "action_quit_app"),
+)
+
+
+def _char_mask(text: str) -> int:
+    """64-bit presence mask of the characters in `text` (bucketed by code point)."""
+    mask = 0
+    for ch in text:
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+class _PaletteEntry(NamedTuple):
+    """A palette command with everything search needs precomputed."""
+
+    name: str
+    name_lc: str
+    inv_len: float
+    mask: int
+    action: str
+    help: str
+
+
+_COMMANDS_LC: tuple[_PaletteEntry, ...] = tuple(
+    _PaletteEntry(name, name.lower(), 1.0 / len(name), _char_mask(name.lower()), action, f"Run {name}")
+    for name, action in _COMMANDS
+)
+
+# Lowercase character -> indices of commands whose name contains it.
+_BY_CHAR: dict[str, tuple[int, ...]] = {
+    ch: tuple(idx for idx, entry in enumerate(_COMMANDS_LC) if ch in entry.name_lc)
+    for ch in sorted({ch for entry in _COMMANDS_LC for ch in entry.name_lc})
+}
+
+
+class _PaletteCmd(NamedTuple):
+    """How a palette action maps onto a `commands.cmd_*` call for the active project."""
+
+    kwargs: Callable[[ProjectInfo], dict[str, Any]]
+    needs_accounts: bool = False
+    success_message: str | None = None
+
+
+def _output_kwargs(proj: ProjectInfo) -> dict[str, Any]:
+    runtime = resolve_runtime_context(proj)
+    return {
+        "manifest_path": proj.manifest_path,
+        "accounts_path": proj.accounts_path,
+        "rpc_url": runtime.rpc_url,
+    }
+
+
+def _accounts_init_kwargs(proj: ProjectInfo) -> dict[str, Any]:
+    runtime = resolve_runtime_context(proj)
+    return {
+        "manifest_path": proj.manifest_path,
+        "rpc_url": runtime.rpc_url,
+        "program_id": runtime.program_id,
+        "payer": runtime.payer,
+        "project_path": proj.path,
+    }
+
+
+# Keyed by the `commands` function name, which is also the palette action name.
+_CMD_TABLE: dict[str, _PaletteCmd] = {
+    "cmd_validate": _PaletteCmd(lambda p: {"manifest_path": p.manifest_path}),
+    "cmd_show": _PaletteCmd(
+        lambda p: {"manifest_path": p.manifest_path},
+        success_message="Manifest loaded — see Models panel",
+    ),
+    "cmd_pack": _PaletteCmd(lambda p: {"manifest_path": p.manifest_path, "update_size": True}),
+    "cmd_build_guest": _PaletteCmd(lambda p: {"manifest_path": p.manifest_path}),
+    "cmd_schema_hash": _PaletteCmd(lambda p: {"manifest_path": p.manifest_path}),
+    "cmd_chunk": _PaletteCmd(lambda p: {"manifest_path": p.manifest_path}),
+    "cmd_accounts_show": _PaletteCmd(lambda p: {"accounts_path": p.accounts_path}, needs_accounts=True),
+    "cmd_output": _PaletteCmd(_output_kwargs, needs_accounts=True),
+    "cmd_accounts_init": _PaletteCmd(_accounts_init_kwargs),
+}
+
+
 class CauldronCommandProvider(Provider):
     """Provides fuzzy-searchable commands for the command palette."""
 
+    async def startup(self) -> None:
+        # One callback per command for the life of the palette, reused across keystrokes.
+        self._callbacks = {entry.action: self._run_command(entry.action) for entry in _COMMANDS_LC}
+
     async def search(self, query: str) -> Hits:
-        commands = [
-            ("Initialize Project", "cmd_initialize_project"),
-            ("Validate Manifest", "cmd_validate"),
-            ("Show Manifest", "cmd_show"),
-            ("Pack Manifest", "cmd_pack"),
-            ("Build Guest", "cmd_build_guest"),
-            ("Schema Hash", "cmd_schema_hash"),
-            ("Chunk Weights", "cmd_chunk"),
-            ("Show Accounts", "cmd_accounts_show"),
-            ("Init Accounts", "cmd_accounts_init"),
-            ("Read Output", "cmd_output"),
-            ("New Project", "action_new_project"),
-            ("Go Home", "action_home"),
-            ("Settings", "action_settings"),
-            ("Wizard Mode", "action_wizard"),
-            ("Copy Agent Context", "action_copy_context"),
-            ("Quit Cauldron", "action_quit_app"),
-        ]
-        for name, action in commands:
-            if query.lower() in name.lower():
+        callbacks = self._callbacks
+        if not query:
+            for entry in _COMMANDS_LC:
+                yield Hit(0.0, entry.name, callbacks[entry.action], help=entry.help)
+            return
+
+        q = query.lower()
+        q_len = len(query)
+        if q_len <= 2:
+            candidates = [_COMMANDS_LC[idx] for idx in _BY_CHAR.get(q[0], ())]
+        else:
+            q_mask = _char_mask(q)
+            candidates = [entry for entry in _COMMANDS_LC if not q_mask & ~entry.mask]
+        for entry in candidates:
+            if q in entry.name_lc:
                 yield Hit(
-                    1.0 - (len(query) / len(name)) if query else 0.0,
-                    name,
-                    self._run_command(action),
-                    help=f"Run {name}",
+                    1.0 - q_len * entry.inv_len,
+                    entry.name,
+                    callbacks[entry.action],
+                    help=entry.help,
                 )
 
     def _run_command(self, action: str):  # noqa: ANN202
+        method = getattr(self.app, action, None)
+
         async def callback() -> None:
-            if hasattr(self.app, action):
-                method = getattr(self.app, action)
+            if method is not None:
                 method()
         return callback
 
@@ -75,28 +176,45 @@ class CauldronApp(App):
         super().__init__()
         self.app_state = AppState(project_path=project_path)
 
-    def on_mount(self) -> None:
+    # Screen classes are imported lazily on first use, then reused.
+
+    @functools.cached_property
+    def _home_screen_cls(self) -> type:
         from .screens.home import HomeScreen
 
-        self.push_screen(HomeScreen())
+        return HomeScreen
 
-    def _is_home_screen(self) -> bool:
-        try:
-            from .screens.home import HomeScreen
+    @functools.cached_property
+    def _project_setup_screen_cls(self) -> type:
+        from .screens.project_setup import ProjectSetupScreen
 
-            return isinstance(self.screen, HomeScreen)
-        except Exception:
-            return self.screen.__class__.__name__ == "HomeScreen"
+        return ProjectSetupScreen
 
-    def action_home(self) -> None:
-        from .screens.home import HomeScreen
+    @functools.cached_property
+    def _settings_screen_cls(self) -> type:
+        from .screens.settings import SettingsScreen
+
+        return SettingsScreen
+
+    @functools.cached_property
+    def _wizard_screen_cls(self) -> type:
+        from .screens.wizard import WizardScreen
+
+        return WizardScreen
+
+    def on_mount(self) -> None:
+        self.push_screen(self._home_screen_cls())
 
+    def _is_home_screen(self) -> bool:
+        return type(self.screen) is self._home_screen_cls
+
+    def action_home(self) -> None:
         if self._is_home_screen():
             return
         while len(self.screen_stack) > 1 and not self._is_home_screen():
             self.pop_screen()
         if not self._is_home_screen():
-            self.push_screen(HomeScreen())
+            self.push_screen(self._home_screen_cls())
 
     def action_back(self) -> None:
         if self._is_home_screen():
@@ -110,50 +228,57 @@ class CauldronApp(App):
         self.exit()
 
     def action_new_project(self) -> None:
-        from .screens.project_setup import ProjectSetupScreen
-
-        self.push_screen(ProjectSetupScreen())
+        self.push_screen(self._project_setup_screen_cls())
 
     def action_settings(self) -> None:
-        from .screens.settings import SettingsScreen
-
-        self.push_screen(SettingsScreen())
+        self.push_screen(self._settings_screen_cls())
 
     def action_copy_context(self) -> None:
         from .agent_context import (
+            context_stamps,
             copy_text_to_clipboard,
             render_agent_context,
             write_agent_context,
         )
 
-        active_project = self.app_state.active_project
-        if not active_project:
-            self.notify("No active project", severity="warning")
+        if (active_project := self._require_project()) is None:
             return
 
         screen = self.screen
-        if hasattr(screen, "action_copy_context"):
+        screen_copy = getattr(screen, "action_copy_context", None)
+        if screen_copy is not None:
             try:
-                getattr(screen, "action_copy_context")()
+                screen_copy()
                 return
             except Exception:
                 pass
 
-        payload = {
-            "source": type(screen).__name__.lower(),
-            "logs": [],
-            "last_error": None,
-        }
-        if hasattr(screen, "export_agent_context_payload"):
+        exported: dict = {}
+        export_payload = getattr(screen, "export_agent_context_payload", None)
+        if export_payload is not None:
             try:
-                exported = getattr(screen, "export_agent_context_payload")()
-                if isinstance(exported, dict):
-                    payload.update(exported)
+                result = export_payload()
+                if isinstance(result, dict):
+                    exported = result
             except Exception:
                 pass
 
-        context_text = render_agent_context(project=active_project, **payload)
-        out_path = write_agent_context(active_project.path, context_text)
+        now_iso, stamp = context_stamps()
+        context_text = render_agent_context(
+            project=active_project,
+            now_iso=now_iso,
+            source=exported.get("source", type(screen).__name__.lower()),
+            workflow_mode=exported.get("workflow_mode"),
+            step_index=exported.get("step_index"),
+            step_name=exported.get("step_name"),
+            step_states=exported.get("step_states"),
+            current_panel=exported.get("current_panel"),
+            logs=exported.get("logs"),
+            last_error=exported.get("last_error"),
+            invoke_signature=exported.get("invoke_signature"),
+            output_data=exported.get("output_data"),
+        )
+        out_path = write_agent_context(active_project, context_text, stamp=stamp)
         copied, tool_msg = copy_text_to_clipboard(context_text)
         if copied:
             self.notify(f"Agent context saved and copied ({tool_msg})", severity="information")
@@ -162,124 +287,57 @@ class CauldronApp(App):
 
     # ── Command wrappers for palette ──────────────────────────────
 
-    def cmd_validate(self) -> None:
+    def _require_project(self) -> ProjectInfo | None:
         proj = self.app_state.active_project
         if not proj:
-            self.notify("No active project", severity="warning")
+            self.notify(_MSG_NO_PROJECT, severity="warning")
+            return None
+        return proj
+
+    def _dispatch_cmd(self, action: str) -> None:
+        spec = _CMD_TABLE[action]
+        if (proj := self._require_project()) is None:
+            return
+        if spec.needs_accounts and (not proj.accounts_path or not proj.accounts_path.exists()):
+            self.notify(_MSG_NO_ACCOUNTS, severity="warning")
             return
-        from .commands import cmd_validate
+        from . import commands
 
-        result = cmd_validate(proj.manifest_path)
+        result = getattr(commands, action)(**spec.kwargs(proj))
         if result.success:
-            self.notify(result.message, severity="information")
+            self.notify(spec.success_message or result.message, severity="information")
         else:
             self.notify(result.message, severity="error")
 
-    def cmd_show(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        from .commands import cmd_show
+    def cmd_validate(self) -> None:
+        self._dispatch_cmd("cmd_validate")
 
-        result = cmd_show(proj.manifest_path)
-        if result.success:
-            self.notify("Manifest loaded — see Models panel", severity="information")
-        else:
-            self.notify(result.message, severity="error")
+    def cmd_show(self) -> None:
+        self._dispatch_cmd("cmd_show")
 
     def cmd_pack(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        from .commands import cmd_pack
-
-        result = cmd_pack(proj.manifest_path, update_size=True)
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_pack")
 
     def cmd_build_guest(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        from .commands import cmd_build_guest
-
-        result = cmd_build_guest(proj.manifest_path)
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_build_guest")
 
     def cmd_schema_hash(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        from .commands import cmd_schema_hash
-
-        result = cmd_schema_hash(proj.manifest_path)
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_schema_hash")
 
     def cmd_chunk(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        from .commands import cmd_chunk
-
-        result = cmd_chunk(manifest_path=proj.manifest_path)
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_chunk")
 
     def cmd_accounts_show(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        if not proj.accounts_path or not proj.accounts_path.exists():
-            self.notify("No accounts file found", severity="warning")
-            return
-        from .commands import cmd_accounts_show
-
-        result = cmd_accounts_show(proj.accounts_path)
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_accounts_show")
 
     def cmd_output(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        if not proj.accounts_path or not proj.accounts_path.exists():
-            self.notify("No accounts file found", severity="warning")
-            return
-        from .commands import cmd_output
-        runtime = resolve_runtime_context(proj)
-
-        result = cmd_output(
-            manifest_path=proj.manifest_path,
-            accounts_path=proj.accounts_path,
-            rpc_url=runtime.rpc_url,
-        )
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_output")
 
     def cmd_accounts_init(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
-            return
-        from .commands import cmd_accounts_init
-        runtime = resolve_runtime_context(proj)
-
-        result = cmd_accounts_init(
-            manifest_path=proj.manifest_path,
-            rpc_url=runtime.rpc_url,
-            program_id=runtime.program_id,
-            payer=runtime.payer,
-            project_path=proj.path,
-        )
-        self.notify(result.message, severity="information" if result.success else "error")
+        self._dispatch_cmd("cmd_accounts_init")
 
     def cmd_initialize_project(self) -> None:
-        proj = self.app_state.active_project
-        if not proj:
-            self.notify("No active project", severity="warning")
+        if (proj := self._require_project()) is None:
             return
 
         # Preferred UX: run initialization inside Manual -> Models so output is visible.
@@ -333,6 +391,4 @@ class CauldronApp(App):
         if not proj:
             self.notify("Select a project first", severity="warning")
             return
-        from .screens.wizard import WizardScreen
-
-        self.push_screen(WizardScreen(project=proj))
+        self.push_screen(self._wizard_screen_cls(project=proj))
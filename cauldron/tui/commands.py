@@ -8,43 +8,57 @@ from __future__ import annotations
 
 import base64
 import json
+import operator
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
-from ..manifest import load_manifest
-from ..validate import validate_manifest
 from ..pack import pack_manifest
 from ..chunk import chunk_manifest, chunk_file
+from ..input import load_payload_from_path, pack_input
+from ..upload import upload_all_chunks, upload_model_chunk
 from ..schema import schema_hash32, format_hash32, update_manifest_schema_hash
 from ..accounts import (
     derive_vm_pda,
-    load_accounts,
     parse_segments,
     resolve_authority_pubkey,
     write_accounts,
 )
-from ..constants import DEFAULT_PROGRAM_ID
+from ..constants import DEFAULT_PROGRAM_ID, MMU_VM_HEADER_SIZE
 from ..helpers import (
+    account_writer,
     apply_accounts_env,
     append_seeded_runner_args,
     extract_halted_status,
     build_upload_env,
     extract_last_execute_signature,
     load_solana_cli_config,
+    resolve_accounts_path,
     resolve_run_onchain,
-    accounts_segment_metas,
     build_control_block,
     decode_output,
     fetch_account_data,
+    loads_json,
     parse_control_block,
     schema_output_info,
     validate_vm_authority_binding,
     wait_for_signature_slot,
-    write_account,
     rpc_request_raw,
+    rust_tool_command,
+    RUST_TOOLS_DIR,
 )
-from .registry import list_projects
+from ._cache import (
+    cached_accounts_segment_metas,
+    cached_load_accounts,
+    cached_load_manifest,
+    cached_validate_manifest,
+    keypair_stat_keys,
+)
+from .registry import REGISTRY_PATH, get_defaults, list_projects
 from .runtime import resolve_runtime_context
 
 ProgressCallback = Callable[[str, float | None], None]
@@ -66,22 +80,23 @@ class CommandResult:
     logs: list[str] = field(default_factory=list)
 
 
+_BLOB_FIELDS = ("name", "file", "hash", "size_bytes")
+_get_blob_fields = operator.attrgetter(*_BLOB_FIELDS)
+
+
 def _blob_updates_to_dicts(updates: list[Any]) -> list[dict[str, Any]]:
     out: list[dict[str, Any]] = []
     for update in updates:
-        out.append(
-            {
-                "name": getattr(update, "name", None),
-                "file": getattr(update, "file", None),
-                "hash": getattr(update, "hash", None),
-                "size_bytes": getattr(update, "size_bytes", None),
-            }
-        )
+        try:
+            values = _get_blob_fields(update)
+        except AttributeError:
+            values = tuple(getattr(update, name, None) for name in _BLOB_FIELDS)
+        out.append(dict(zip(_BLOB_FIELDS, values)))
     return out
 
 
 def _resolve_weights_output_path(manifest_path: Path) -> Path:
-    manifest = load_manifest(manifest_path)
+    manifest = cached_load_manifest(manifest_path, readonly=True)
     weights = manifest.get("weights")
     if isinstance(weights, dict):
         blobs = weights.get("blobs")
@@ -115,6 +130,17 @@ def _flatten_chunk_results(results: list[Any]) -> tuple[list[str], list[dict[str
     return chunk_paths, summary
 
 
+def _decode_output(raw: bytes | None) -> str:
+    return raw.decode("utf-8", "replace") if raw else ""
+
+
+def _process_logs(stdout: bytes | None, stderr: bytes | None) -> list[str]:
+    logs = _decode_output(stdout).strip().splitlines()
+    if stderr:
+        logs += _decode_output(stderr).strip().splitlines()
+    return logs
+
+
 def _parse_label_col(label_col: str | int | None) -> str | int | None:
     if not isinstance(label_col, str):
         return label_col
@@ -129,13 +155,15 @@ def _parse_label_col(label_col: str | int | None) -> str | int | None:
 
 def _normalize_decoded_output(decoded: str) -> Any:
     try:
-        return json.loads(decoded)
+        return loads_json(decoded)
     except Exception:
         return decoded
 
 
 def _normalize_rpc_url(url: str | None) -> str:
     if isinstance(url, str):
+        if url and url[-1] != "/" and not url[0].isspace() and not url[-1].isspace():
+            return url
         cleaned = url.strip().rstrip("/")
         if cleaned:
             return cleaned
@@ -186,7 +214,7 @@ def _build_seed_fingerprint_from_accounts(
     program_id: str | None = None,
     payer: str | None = None,
 ) -> _SeedFingerprint | None:
-    info, _ = accounts_segment_metas(
+    info, _ = cached_accounts_segment_metas(
         str(accounts_path),
         program_id_override=program_id,
         payer_override=payer,
@@ -195,16 +223,9 @@ def _build_seed_fingerprint_from_accounts(
     authority_pubkey = info.get("authority_pubkey")
     vm_pubkey = info.get("vm_pubkey")
     effective_program_id = program_id or info.get("program_id")
-    if not (
-        isinstance(vm_seed, str)
-        and vm_seed
-        and isinstance(authority_pubkey, str)
-        and authority_pubkey
-        and isinstance(vm_pubkey, str)
-        and vm_pubkey
-        and isinstance(effective_program_id, str)
-        and effective_program_id
-    ):
+    # accounts_segment_metas reports these as str | None, so truthiness is
+    # enough to reject missing values.
+    if not (vm_seed and authority_pubkey and vm_pubkey and effective_program_id):
         return None
     return _SeedFingerprint(
         rpc_url=_normalize_rpc_url(rpc_url or info.get("rpc_url")),
@@ -215,6 +236,101 @@ def _build_seed_fingerprint_from_accounts(
     )
 
 
+# Resolved accounts path -> (mtime_ns, (rpc_url, program_id, payer),
+# keypair stat keys, fingerprint).
+_FP_CACHE: dict[str, tuple[int, tuple[str | None, ...], tuple[Any, ...], _SeedFingerprint | None]] = {}
+
+
+def _fingerprint_for_project(project: Any) -> tuple[Any, _SeedFingerprint] | None:
+    accounts_path = _resolve_project_accounts_path(project)
+    if not isinstance(accounts_path, Path):
+        return None
+    try:
+        resolved = accounts_path.resolve()
+        mtime_ns = resolved.stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        context = resolve_runtime_context(project)
+        context_key = (context.rpc_url, context.program_id, context.payer)
+        keypairs = keypair_stat_keys(resolved, context.payer)
+        key = str(resolved)
+        cached = _FP_CACHE.get(key)
+        if cached is not None and cached[:3] == (mtime_ns, context_key, keypairs):
+            fp = cached[3]
+        else:
+            fp = _build_seed_fingerprint_from_accounts(
+                accounts_path,
+                rpc_url=context.rpc_url,
+                program_id=context.program_id,
+                payer=context.payer,
+            )
+            _FP_CACHE[key] = (mtime_ns, context_key, keypairs, fp)
+    except Exception:
+        return None
+    if fp is None:
+        return None
+    return project, fp
+
+
+_CollisionKey = tuple[str, str, str, str]
+# (resolved project path, project, fingerprint); the path is resolved once per rebuild.
+_CollisionEntry = tuple[Path | None, Any, _SeedFingerprint]
+_COLLISION_INDEX: tuple[tuple[Any, ...], dict[_CollisionKey, list[_CollisionEntry]]] | None = None
+
+
+def _collision_key(fp: _SeedFingerprint) -> _CollisionKey:
+    return fp.rpc_url, fp.program_id, fp.authority_pubkey, fp.vm_seed
+
+
+def _collision_index() -> dict[_CollisionKey, list[_CollisionEntry]]:
+    """Fingerprints of all registered projects grouped by collision key.
+
+    The index is rebuilt only when the registry file, any project's accounts
+    file or a keypair file it references changes; otherwise a lookup costs a
+    few stats per project.
+    """
+    global _COLLISION_INDEX
+    projects = list_projects()
+    try:
+        reg_stat = REGISTRY_PATH.stat()
+        token_parts: list[Any] = [(reg_stat.st_mtime_ns, reg_stat.st_size)]
+    except OSError:
+        token_parts = [None]
+    defaults = get_defaults() if projects else {}
+    default_payer = (defaults.get("default_payer") or "").strip() or None
+    for project in projects:
+        accounts_path = _resolve_project_accounts_path(project)
+        mtime_ns = None
+        keypairs: tuple[Any, ...] = ()
+        if isinstance(accounts_path, Path):
+            try:
+                mtime_ns = accounts_path.stat().st_mtime_ns
+            except OSError:
+                pass
+            payer = (getattr(project, "payer", None) or "").strip() or default_payer
+            keypairs = keypair_stat_keys(accounts_path, payer)
+        token_parts.append((str(getattr(project, "path", None)), str(accounts_path), mtime_ns, keypairs))
+    token = tuple(token_parts)
+    if _COLLISION_INDEX is not None and _COLLISION_INDEX[0] == token:
+        return _COLLISION_INDEX[1]
+
+    index: dict[_CollisionKey, list[_CollisionEntry]] = {}
+    if projects:
+        # Fingerprinting is file parsing plus PDA derivation per project;
+        # overlap it across threads while keeping registry order per key.
+        with ThreadPoolExecutor(max_workers=min(32, len(projects))) as executor:
+            for found in executor.map(_fingerprint_for_project, projects):
+                if found is None:
+                    continue
+                project, fp = found
+                project_path = getattr(project, "path", None)
+                resolved = project_path.resolve() if isinstance(project_path, Path) else None
+                index.setdefault(_collision_key(fp), []).append((resolved, project, fp))
+    _COLLISION_INDEX = (token, index)
+    return index
+
+
 def _find_seed_collision_for_fingerprint(
     *,
     current_fp: _SeedFingerprint,
@@ -222,33 +338,10 @@ def _find_seed_collision_for_fingerprint(
 ) -> tuple[Any, _SeedFingerprint] | None:
     current_project_path = project_path.resolve() if isinstance(project_path, Path) else None
 
-    for project in list_projects():
-        other_project_path = getattr(project, "path", None)
-        if isinstance(other_project_path, Path):
-            if current_project_path and other_project_path.resolve() == current_project_path:
-                continue
-        other_accounts_path = _resolve_project_accounts_path(project)
-        if not isinstance(other_accounts_path, Path) or not other_accounts_path.exists():
-            continue
-        try:
-            context = resolve_runtime_context(project)
-            other_fp = _build_seed_fingerprint_from_accounts(
-                other_accounts_path,
-                rpc_url=context.rpc_url,
-                program_id=context.program_id,
-                payer=context.payer,
-            )
-        except Exception:
-            continue
-        if other_fp is None:
+    for other_project_path, project, other_fp in _collision_index().get(_collision_key(current_fp), ()):
+        if current_project_path and other_project_path == current_project_path:
             continue
-        if (
-            other_fp.rpc_url == current_fp.rpc_url
-            and other_fp.program_id == current_fp.program_id
-            and other_fp.authority_pubkey == current_fp.authority_pubkey
-            and other_fp.vm_seed == current_fp.vm_seed
-        ):
-            return project, other_fp
+        return project, other_fp
     return None
 
 
@@ -281,26 +374,18 @@ def _detect_seed_collision(
 def _parse_mapped_pubkeys(mapped_lines: list[str]) -> list[str]:
     pubkeys: list[str] = []
     for line in mapped_lines:
-        if not isinstance(line, str) or ":" not in line:
+        if not isinstance(line, str):
             continue
-        _, pubkey = line.split(":", 1)
-        value = pubkey.strip()
-        if value:
+        _, sep, rest = line.partition(":")
+        if sep and (value := rest.strip()):
             pubkeys.append(value)
     return pubkeys
 
 
-def _fetch_account_snapshot(rpc_url: str, pubkey: str) -> dict[str, Any]:
-    payload = rpc_request_raw(
-        rpc_url,
-        "getAccountInfo",
-        [pubkey, {"encoding": "base64", "commitment": "confirmed"}],
-    )
-    error = payload.get("error")
-    if error is not None:
-        raise ValueError(f"RPC error: {error}")
-    result = payload.get("result")
-    value = result.get("value") if isinstance(result, dict) else None
+_MULTIPLE_ACCOUNTS_LIMIT = 100
+
+
+def _account_snapshot_from_value(value: Any) -> dict[str, Any]:
     if value is None:
         raise ValueError("account not found")
     if not isinstance(value, dict):
@@ -313,19 +398,75 @@ def _fetch_account_snapshot(rpc_url: str, pubkey: str) -> dict[str, Any]:
     elif isinstance(data, str):
         raw_data = data
 
-    try:
-        decoded = base64.b64decode(raw_data, validate=False) if raw_data else b""
-    except Exception as exc:
-        raise ValueError(f"unable to decode account data: {exc}") from exc
+    if len(raw_data) % 4 == 0:
+        # Padded base64 from the RPC: the byte length follows from the text
+        # length, so large accounts are not decoded just to be measured.
+        data_len = len(raw_data) // 4 * 3 - raw_data[-2:].count("=")
+    else:
+        try:
+            # Unpadded text: restore the padding b64decode insists on.
+            data_len = len(base64.b64decode(raw_data + "=" * (-len(raw_data) % 4), validate=False))
+        except Exception as exc:
+            raise ValueError(f"unable to decode account data: {exc}") from exc
 
     return {
         "owner": value.get("owner"),
         "lamports": value.get("lamports"),
-        "data_len": len(decoded),
+        "data_len": data_len,
         "executable": bool(value.get("executable", False)),
     }
 
 
+def _fetch_account_snapshot(rpc_url: str, pubkey: str) -> dict[str, Any]:
+    payload = rpc_request_raw(
+        rpc_url,
+        "getAccountInfo",
+        [pubkey, {"encoding": "base64", "commitment": "confirmed"}],
+    )
+    error = payload.get("error")
+    if error is not None:
+        raise ValueError(f"RPC error: {error}")
+    result = payload.get("result")
+    value = result.get("value") if isinstance(result, dict) else None
+    return _account_snapshot_from_value(value)
+
+
+def _fetch_account_snapshots(
+    rpc_url: str,
+    pubkeys: list[str],
+) -> list[dict[str, Any] | Exception]:
+    """Fetch snapshots with getMultipleAccounts, aligned with ``pubkeys``.
+
+    Each entry is either a snapshot dict or the exception describing why that
+    account could not be read. Requests are split at the RPC's 100-key cap.
+    """
+    out: list[dict[str, Any] | Exception] = []
+    for start in range(0, len(pubkeys), _MULTIPLE_ACCOUNTS_LIMIT):
+        batch = pubkeys[start : start + _MULTIPLE_ACCOUNTS_LIMIT]
+        try:
+            payload = rpc_request_raw(
+                rpc_url,
+                "getMultipleAccounts",
+                [batch, {"encoding": "base64", "commitment": "confirmed"}],
+            )
+            error = payload.get("error")
+            if error is not None:
+                raise ValueError(f"RPC error: {error}")
+            result = payload.get("result")
+            values = result.get("value") if isinstance(result, dict) else None
+            if not isinstance(values, list) or len(values) != len(batch):
+                raise ValueError("unexpected getMultipleAccounts payload")
+        except Exception as exc:
+            out.extend(exc for _ in batch)
+            continue
+        for value in values:
+            try:
+                out.append(_account_snapshot_from_value(value))
+            except Exception as exc:
+                out.append(exc)
+    return out
+
+
 def _audit_seeded_accounts_on_chain(
     *,
     rpc_url: str | None,
@@ -339,20 +480,14 @@ def _audit_seeded_accounts_on_chain(
     if not expected_pubkeys:
         return ["No accounts supplied for post-create verification"], {}
 
-    seen: set[str] = set()
-    ordered_expected: list[str] = []
-    for pubkey in expected_pubkeys:
-        if pubkey and pubkey not in seen:
-            ordered_expected.append(pubkey)
-            seen.add(pubkey)
+    ordered_expected = list(dict.fromkeys(pk for pk in expected_pubkeys if pk))
 
     errors: list[str] = []
     snapshots: dict[str, dict[str, Any]] = {}
-    for pubkey in ordered_expected:
-        try:
-            snapshot = _fetch_account_snapshot(rpc_url, pubkey)
-        except Exception as exc:
-            errors.append(f"{pubkey}: {exc}")
+    fetched = _fetch_account_snapshots(rpc_url, ordered_expected)
+    for pubkey, snapshot in zip(ordered_expected, fetched):
+        if isinstance(snapshot, Exception):
+            errors.append(f"{pubkey}: {snapshot}")
             continue
         snapshots[pubkey] = snapshot
 
@@ -367,14 +502,58 @@ def _audit_seeded_accounts_on_chain(
     return errors, snapshots
 
 
+@dataclass(frozen=True)
+class _RunnerContext:
+    """Accounts metadata plus the subprocess env shared by the VM-facing commands."""
+
+    info: dict[str, str | None]
+    mapped_lines: list[str]
+    rpc_url: str | None
+    payer: str | None
+    program_id: str | None
+    env: dict[str, str]
+
+
+def _runner_context(
+    accounts_path: Path,
+    *,
+    rpc_url: str | None = None,
+    payer: str | None = None,
+    program_id: str | None = None,
+) -> _RunnerContext:
+    info, mapped_lines = cached_accounts_segment_metas(
+        str(accounts_path), program_id_override=program_id, payer_override=payer,
+    )
+    effective_rpc = rpc_url or info.get("rpc_url")
+    effective_payer = payer or (info.get("payer") if isinstance(info.get("payer"), str) else None)
+    pid = program_id or info.get("program_id")
+
+    env = os.environ.copy()
+    if effective_rpc:
+        env["FROSTBITE_RPC_URL"] = effective_rpc
+    if effective_payer:
+        env["FROSTBITE_PAYER_KEYPAIR"] = effective_payer
+    if pid:
+        env["FROSTBITE_PROGRAM_ID"] = pid
+    elif "FROSTBITE_PROGRAM_ID" not in env:
+        env["FROSTBITE_PROGRAM_ID"] = DEFAULT_PROGRAM_ID
+    return _RunnerContext(
+        info=info,
+        mapped_lines=mapped_lines,
+        rpc_url=effective_rpc,
+        payer=effective_payer,
+        program_id=pid,
+        env=env,
+    )
+
+
 # ── Validate ──────────────────────────────────────────────────────
 
 
 def cmd_validate(manifest_path: Path) -> CommandResult:
     """Validate a manifest against the Frostbite spec."""
     try:
-        manifest = load_manifest(manifest_path)
-        errors = validate_manifest(manifest)
+        errors = cached_validate_manifest(manifest_path)
         if errors:
             return CommandResult(
                 success=False,
@@ -392,7 +571,7 @@ def cmd_validate(manifest_path: Path) -> CommandResult:
 def cmd_show(manifest_path: Path) -> CommandResult:
     """Load and return manifest sections as structured data."""
     try:
-        manifest = load_manifest(manifest_path)
+        manifest = cached_load_manifest(manifest_path)
         return CommandResult(
             success=True,
             message="Manifest loaded",
@@ -411,7 +590,7 @@ def cmd_schema_hash(
 ) -> CommandResult:
     """Compute the schema hash for a manifest."""
     try:
-        manifest = load_manifest(manifest_path)
+        manifest = cached_load_manifest(manifest_path, readonly=True)
         h = schema_hash32(manifest)
         if h is None:
             return CommandResult(success=False, message="Cannot compute schema hash for this schema type")
@@ -466,7 +645,7 @@ def cmd_init(
             line
             for block in (stdout_buf.getvalue(), stderr_buf.getvalue())
             for line in block.splitlines()
-            if line.strip()
+            if line and not line.isspace()
         ]
         if rc == 0:
             return CommandResult(
@@ -600,8 +779,7 @@ def cmd_build_guest(
     from ..guest import write_guest_config, build_guest
 
     try:
-        manifest = load_manifest(manifest_path)
-        errors = validate_manifest(manifest)
+        errors = cached_validate_manifest(manifest_path)
         if errors:
             return CommandResult(success=False, message="Manifest validation failed", errors=errors)
 
@@ -666,7 +844,7 @@ def cmd_chunk(
 def cmd_accounts_show(accounts_path: Path) -> CommandResult:
     """Display account mapping and derived PDA pubkeys."""
     try:
-        info, mapped_lines = accounts_segment_metas(str(accounts_path))
+        info, mapped_lines = cached_accounts_segment_metas(str(accounts_path))
         return CommandResult(
             success=True,
             message="Accounts loaded",
@@ -695,7 +873,7 @@ def cmd_output(
 ) -> CommandResult:
     """Read model inference output from VM scratch memory."""
     try:
-        manifest = load_manifest(manifest_path)
+        manifest = cached_load_manifest(manifest_path, readonly=True)
         abi = manifest.get("abi")
         if not isinstance(abi, dict):
             return CommandResult(success=False, message="Manifest missing abi table")
@@ -709,7 +887,7 @@ def cmd_output(
         if not isinstance(output_max, int):
             return CommandResult(success=False, message="abi.output_max must be an integer")
 
-        info, _ = accounts_segment_metas(str(accounts_path))
+        info, _ = cached_accounts_segment_metas(str(accounts_path))
         effective_rpc = rpc_url or info.get("rpc_url") or "http://127.0.0.1:8899"
         if not isinstance(effective_rpc, str):
             return CommandResult(success=False, message="Invalid rpc_url")
@@ -724,8 +902,6 @@ def cmd_output(
             )
             min_context_slot = slot
 
-        from ..constants import MMU_VM_HEADER_SIZE
-
         raw = fetch_account_data(
             effective_rpc, vm_pubkey,
             commitment=commitment,
@@ -790,8 +966,6 @@ def cmd_accounts_init(
     allow_seed_reuse: bool = False,
 ) -> CommandResult:
     """Generate accounts configuration (PDA mode)."""
-    import secrets
-
     try:
         cfg = load_solana_cli_config()
         effective_out = out_path
@@ -810,7 +984,7 @@ def cmd_accounts_init(
         manifest_cfg: dict[str, Any] | None = None
         effective_entry_pc = entry_pc
         if manifest_path:
-            loaded = load_manifest(manifest_path)
+            loaded = cached_load_manifest(manifest_path)
             if isinstance(loaded, dict):
                 manifest_cfg = loaded
             if effective_entry_pc is None and manifest_cfg is not None:
@@ -826,7 +1000,7 @@ def cmd_accounts_init(
             "payer": payer or cfg.get("keypair_path"),
         }
         vm_entry: dict[str, str | int] = {
-            "seed": vm_seed if vm_seed is not None else secrets.randbits(64),
+            "seed": vm_seed if vm_seed is not None else int.from_bytes(os.urandom(8), "little"),
             "entry": effective_entry_pc,
             "account_model": "seeded",
         }
@@ -941,12 +1115,9 @@ def cmd_accounts_create(
     allow_seed_reuse: bool = False,
 ) -> CommandResult:
     """Create on-chain accounts (PDA mode via Rust tools)."""
-    import os
-    import subprocess
-
     try:
         cfg = load_solana_cli_config()
-        info, mapped_lines = accounts_segment_metas(
+        info, mapped_lines = cached_accounts_segment_metas(
             str(accounts_path),
             program_id_override=program_id,
             payer_override=payer,
@@ -955,7 +1126,7 @@ def cmd_accounts_create(
         if not isinstance(vm_seed, str) or not vm_seed:
             return CommandResult(success=False, message="Accounts require vm.seed (PDA mode)")
 
-        accounts = load_accounts(str(accounts_path))
+        accounts = cached_load_accounts(accounts_path, readonly=True)
         vm = accounts.get("vm") if isinstance(accounts.get("vm"), dict) else {}
         validate_vm_authority_binding(str(accounts_path), vm)
         segments = parse_segments(accounts)
@@ -996,13 +1167,15 @@ def cmd_accounts_create(
         skipped_weights_without_size = False
         for seg in segments:
             kind = seg.kind.strip().lower()
+            slot = seg.slot
+            seg_bytes = seg.bytes if isinstance(seg.bytes, int) else None
             if kind == "ram":
-                payload = seg.bytes if isinstance(seg.bytes, int) and seg.bytes > 0 else ram_bytes
-                segment_specs.append(f"ram:{seg.slot}:{payload}")
-                created_slots.add(seg.slot)
-            elif kind == "weights" and isinstance(seg.bytes, int) and seg.bytes >= 0:
-                segment_specs.append(f"weights:{seg.slot}:{seg.bytes}")
-                created_slots.add(seg.slot)
+                payload = seg_bytes if seg_bytes is not None and seg_bytes > 0 else ram_bytes
+                segment_specs.append(f"ram:{slot}:{payload}")
+                created_slots.add(slot)
+            elif kind == "weights" and seg_bytes is not None and seg_bytes >= 0:
+                segment_specs.append(f"weights:{slot}:{seg_bytes}")
+                created_slots.add(slot)
             elif kind == "weights":
                 skipped_weights_without_size = True
 
@@ -1017,10 +1190,8 @@ def cmd_accounts_create(
             env["FROSTBITE_PROGRAM_ID"] = DEFAULT_PROGRAM_ID
 
         # Authority handling
-        from ..accounts import resolve_authority_pubkey
         auth_kp = vm.get("authority_keypair")
         if isinstance(auth_kp, str) and auth_kp:
-            from ..helpers import resolve_accounts_path
             resolved_kp = resolve_accounts_path(str(accounts_path), auth_kp)
             env["FROSTBITE_AUTHORITY_KEYPAIR"] = resolved_kp
         authority_pubkey = resolve_authority_pubkey(
@@ -1030,19 +1201,14 @@ def cmd_accounts_create(
         if authority_pubkey:
             env["FROSTBITE_AUTHORITY_PUBKEY"] = authority_pubkey
 
-        rust_tools = Path(__file__).resolve().parent.parent / "rust_tools"
-        cmd = ["cargo", "run", "--bin", "init_pda_accounts", "--", "--vm-seed", vm_seed]
+        cmd = [*rust_tool_command("init_pda_accounts"), "--vm-seed", vm_seed]
         for spec in segment_specs:
             cmd.extend(["--segment", spec])
 
         if on_progress:
             on_progress(f"Running: {' '.join(cmd)}", None)
-        proc = subprocess.run(cmd, env=env, cwd=str(rust_tools), capture_output=True, text=True)
-        logs = []
-        if proc.stdout:
-            logs.extend(proc.stdout.strip().splitlines())
-        if proc.stderr:
-            logs.extend(proc.stderr.strip().splitlines())
+        proc = subprocess.run(cmd, env=env, cwd=str(RUST_TOOLS_DIR), capture_output=True)
+        logs = _process_logs(proc.stdout, proc.stderr)
 
         if proc.returncode == 0:
             if skipped_weights_without_size:
@@ -1118,46 +1284,21 @@ def cmd_accounts_close_vm(
     payer: str | None = None,
 ) -> CommandResult:
     """Close VM PDA and reclaim rent."""
-    import os
-    import subprocess
-
-    from ..constants import DEFAULT_PROGRAM_ID
-
     try:
-        info, _ = accounts_segment_metas(
-            str(accounts_path),
-            program_id_override=program_id,
-            payer_override=payer,
-        )
-        vm_seed = info.get("vm_seed")
+        ctx = _runner_context(accounts_path, rpc_url=rpc_url, payer=payer, program_id=program_id)
+        vm_seed = ctx.info.get("vm_seed")
         if not isinstance(vm_seed, str) or not vm_seed:
             return CommandResult(success=False, message="close-vm requires vm.seed (PDA mode)")
 
-        env = os.environ.copy()
-        if rpc_url or info.get("rpc_url"):
-            env["FROSTBITE_RPC_URL"] = rpc_url or info["rpc_url"]
-        if payer or info.get("payer"):
-            env["FROSTBITE_PAYER_KEYPAIR"] = payer or info["payer"]
-        pid = program_id or info.get("program_id")
-        if pid:
-            env["FROSTBITE_PROGRAM_ID"] = pid
-        elif "FROSTBITE_PROGRAM_ID" not in env:
-            env["FROSTBITE_PROGRAM_ID"] = DEFAULT_PROGRAM_ID
-
-        env = apply_accounts_env(env, str(accounts_path), require_weights_keypair=False)
+        env = apply_accounts_env(ctx.env, str(accounts_path), require_weights_keypair=False)
 
-        rust_tools = Path(__file__).resolve().parent.parent / "rust_tools"
         args = ["close-vm", "--vm-seed", vm_seed]
         if recipient:
             args.extend(["--recipient", recipient])
-        cmd = ["cargo", "run", "--bin", "pda_account_ops", "--", *args]
+        cmd = [*rust_tool_command("pda_account_ops"), *args]
 
-        proc = subprocess.run(cmd, env=env, cwd=str(rust_tools), capture_output=True, text=True)
-        logs = []
-        if proc.stdout:
-            logs.extend(proc.stdout.strip().splitlines())
-        if proc.stderr:
-            logs.extend(proc.stderr.strip().splitlines())
+        proc = subprocess.run(cmd, env=env, cwd=str(RUST_TOOLS_DIR), capture_output=True)
+        logs = _process_logs(proc.stdout, proc.stderr)
 
         if proc.returncode == 0:
             return CommandResult(success=True, message="VM closed", logs=logs)
@@ -1179,8 +1320,6 @@ def cmd_upload(
     on_progress: ProgressCallback | None = None,
 ) -> CommandResult:
     """Upload weight chunks to on-chain accounts."""
-    from ..upload import upload_model_chunk, upload_all_chunks
-
     try:
         if not file_path and not glob_pattern:
             return CommandResult(success=False, message="Provide --file or --all glob pattern")
@@ -1227,14 +1366,8 @@ def cmd_input_write(
     on_progress: ProgressCallback | None = None,
 ) -> CommandResult:
     """Write input data and control block to VM scratch memory."""
-    import os
-    import tempfile
-
-    from ..constants import DEFAULT_PROGRAM_ID, MMU_VM_HEADER_SIZE
-    from ..input import pack_input, load_payload_from_path
-
     try:
-        manifest = load_manifest(str(manifest_path))
+        manifest = cached_load_manifest(str(manifest_path))
 
         # Resolve header inclusion
         effective_header = include_header
@@ -1252,6 +1385,16 @@ def cmd_input_write(
         if input_bin:
             if schema_type != "custom":
                 return CommandResult(success=False, message="--input-bin only for custom schemas")
+            # Reject oversized blobs from their size alone; packing only ever
+            # adds a header, so reading them in full could not succeed.
+            abi_cfg = manifest.get("abi")
+            bin_max = abi_cfg.get("input_max", 4096) if isinstance(abi_cfg, dict) else None
+            bin_size = input_bin.stat().st_size
+            if isinstance(bin_max, int) and bin_size > bin_max:
+                return CommandResult(
+                    success=False,
+                    message=f"Input {bin_size} bytes exceeds abi.input_max {bin_max}",
+                )
             payload = input_bin.read_bytes()
         elif data_path:
             payload = load_payload_from_path(data_path)
@@ -1286,45 +1429,27 @@ def cmd_input_write(
             control_size, input_offset, len(payload_bytes), output_offset, 0,
         )
 
-        info, _ = accounts_segment_metas(
-            str(accounts_path), program_id_override=program_id, payer_override=payer,
-        )
-        vm_pubkey = info.get("vm_pubkey")
+        ctx = _runner_context(accounts_path, rpc_url=rpc_url, payer=payer, program_id=program_id)
+        vm_pubkey = ctx.info.get("vm_pubkey")
         if not vm_pubkey:
             return CommandResult(success=False, message="Accounts file missing vm pubkey")
-
-        env = os.environ.copy()
-        if rpc_url or info.get("rpc_url"):
-            env["FROSTBITE_RPC_URL"] = rpc_url or info["rpc_url"]
-        if payer or info.get("payer"):
-            env["FROSTBITE_PAYER_KEYPAIR"] = payer or info["payer"]
-        pid = program_id or info.get("program_id")
-        if pid:
-            env["FROSTBITE_PROGRAM_ID"] = pid
-        elif "FROSTBITE_PROGRAM_ID" not in env:
-            env["FROSTBITE_PROGRAM_ID"] = DEFAULT_PROGRAM_ID
+        env = ctx.env
 
         input_write_offset = MMU_VM_HEADER_SIZE + input_offset
         control_write_offset = MMU_VM_HEADER_SIZE + control_offset
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            input_file = tmp_path / "input.bin"
-            control_file = tmp_path / "control.bin"
-            input_file.write_bytes(payload_bytes)
-            control_file.write_bytes(control_bytes)
-
-            if on_progress:
-                on_progress(f"Writing input ({len(payload_bytes)}B) @ 0x{input_write_offset:X}", 0.3)
-            rc = write_account(env, vm_pubkey, input_write_offset, input_file, chunk_size)
+        if on_progress:
+            on_progress(f"Writing input ({len(payload_bytes)}B) @ 0x{input_write_offset:X}", 0.3)
+        with account_writer(env, vm_pubkey, chunk_size) as write:
+            rc, error = write(input_write_offset, payload_bytes)
             if rc != 0:
-                return CommandResult(success=False, message=f"Input write failed (rc={rc})")
+                return CommandResult(success=False, message=f"Input write failed (rc={rc}): {error}")
 
             if on_progress:
                 on_progress(f"Writing control ({len(control_bytes)}B) @ 0x{control_write_offset:X}", 0.8)
-            rc = write_account(env, vm_pubkey, control_write_offset, control_file, chunk_size)
+            rc, error = write(control_write_offset, control_bytes)
             if rc != 0:
-                return CommandResult(success=False, message=f"Control write failed (rc={rc})")
+                return CommandResult(success=False, message=f"Control write failed (rc={rc}): {error}")
 
         return CommandResult(
             success=True,
@@ -1348,37 +1473,22 @@ def cmd_program_load(
     on_progress: ProgressCallback | None = None,
 ) -> CommandResult:
     """Load guest ELF into existing VM."""
-    import os
-    import subprocess
-
-    from ..constants import DEFAULT_PROGRAM_ID
-
     try:
-        info, _ = accounts_segment_metas(
-            str(accounts_path), program_id_override=program_id, payer_override=payer,
-        )
+        ctx = _runner_context(accounts_path, rpc_url=rpc_url, payer=payer, program_id=program_id)
+        info = ctx.info
         vm_pubkey = info.get("vm_pubkey")
         if not vm_pubkey:
             return CommandResult(success=False, message="Accounts file missing vm pubkey")
-
-        env = os.environ.copy()
-        if rpc_url or info.get("rpc_url"):
-            env["FROSTBITE_RPC_URL"] = rpc_url or info["rpc_url"]
-        effective_payer = payer or (info.get("payer") if isinstance(info.get("payer"), str) else None)
-        if effective_payer:
-            env["FROSTBITE_PAYER_KEYPAIR"] = effective_payer
-        pid = program_id or info.get("program_id")
-        if pid:
-            env["FROSTBITE_PROGRAM_ID"] = pid
-        elif "FROSTBITE_PROGRAM_ID" not in env:
-            env["FROSTBITE_PROGRAM_ID"] = DEFAULT_PROGRAM_ID
+        env = ctx.env
+        effective_payer = ctx.payer
+        pid = ctx.program_id
 
         run_onchain = resolve_run_onchain()
         cmd = [run_onchain, str(program_path), "--vm", vm_pubkey, "--load", "--load-only"]
         append_seeded_runner_args(cmd, str(accounts_path), info, payer_keypair=effective_payer)
 
-        if rpc_url or info.get("rpc_url"):
-            cmd.extend(["--rpc", rpc_url or info["rpc_url"]])
+        if ctx.rpc_url:
+            cmd.extend(["--rpc", ctx.rpc_url])
         if effective_payer:
             cmd.extend(["--keypair", effective_payer])
         effective_pid = pid or DEFAULT_PROGRAM_ID
@@ -1388,12 +1498,8 @@ def cmd_program_load(
 
         if on_progress:
             on_progress(f"Loading program: {program_path.name}", None)
-        proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
-        logs = []
-        if proc.stdout:
-            logs.extend(proc.stdout.strip().splitlines())
-        if proc.stderr:
-            logs.extend(proc.stderr.strip().splitlines())
+        proc = subprocess.run(cmd, env=env, capture_output=True)
+        logs = _process_logs(proc.stdout, proc.stderr)
 
         if proc.returncode == 0:
             return CommandResult(success=True, message="Program loaded", logs=logs)
@@ -1422,39 +1528,29 @@ def cmd_invoke(
     on_progress: ProgressCallback | None = None,
 ) -> CommandResult:
     """Invoke inference on-chain."""
-    import os
-    import subprocess
-
-    from ..constants import DEFAULT_PROGRAM_ID
-
+    mapped_path: Path | None = None
     try:
         if fast:
             if program_path:
                 return CommandResult(success=False, message="--fast cannot be combined with --program-path")
             no_simulate = True
 
-        info, mapped_lines = accounts_segment_metas(
-            str(accounts_path), program_id_override=program_id, payer_override=payer,
-        )
+        ctx = _runner_context(accounts_path, rpc_url=rpc_url, payer=payer, program_id=program_id)
+        info = ctx.info
         vm_pubkey = info.get("vm_pubkey")
         if not vm_pubkey:
             return CommandResult(success=False, message="Accounts file missing vm pubkey")
-
-        env = os.environ.copy()
-        if rpc_url or info.get("rpc_url"):
-            env["FROSTBITE_RPC_URL"] = rpc_url or info["rpc_url"]
-        effective_payer = payer or (info.get("payer") if isinstance(info.get("payer"), str) else None)
-        if effective_payer:
-            env["FROSTBITE_PAYER_KEYPAIR"] = effective_payer
-        pid = program_id or info.get("program_id")
-        if pid:
-            env["FROSTBITE_PROGRAM_ID"] = pid
-        elif "FROSTBITE_PROGRAM_ID" not in env:
-            env["FROSTBITE_PROGRAM_ID"] = DEFAULT_PROGRAM_ID
-
-        # Write mapped accounts
-        mapped_path = Path("mapped_accounts.txt")
-        mapped_path.write_text("\n".join(mapped_lines) + "\n")
+        env = ctx.env
+        effective_payer = ctx.payer
+        pid = ctx.program_id
+        mapped_lines = ctx.mapped_lines
+
+        # Write mapped accounts to a private file so concurrent invokes do
+        # not share (or leave behind) mapped_accounts.txt in the CWD.
+        fd, mapped_name = tempfile.mkstemp(prefix="cauldron-mapped-", suffix=".txt")
+        mapped_path = Path(mapped_name)
+        with os.fdopen(fd, "w") as mapped_file:
+            mapped_file.writelines(f"{line}\n" for line in mapped_lines)
         has_writable = any(line.startswith("rw:") for line in mapped_lines)
         seeded_mode = isinstance(info.get("vm_seed"), str) and bool(info.get("vm_seed"))
 
@@ -1491,8 +1587,8 @@ def cmd_invoke(
             base_cmd.extend(["--ram-count", "0"])
         if compute_limit is not None:
             base_cmd.extend(["--compute-limit", str(compute_limit)])
-        if rpc_url or info.get("rpc_url"):
-            base_cmd.extend(["--rpc", rpc_url or info["rpc_url"]])
+        if ctx.rpc_url:
+            base_cmd.extend(["--rpc", ctx.rpc_url])
         if effective_payer:
             base_cmd.extend(["--keypair", effective_payer])
         effective_pid = pid or DEFAULT_PROGRAM_ID
@@ -1520,10 +1616,8 @@ def cmd_invoke(
             nonlocal sig
             if on_progress:
                 on_progress(f"Invoking: {' '.join(cmd[:4])}...", None)
-            proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
-            stdout_text = proc.stdout if isinstance(proc.stdout, str) else ""
-            stderr_text = proc.stderr if isinstance(proc.stderr, str) else ""
-            output_text = stdout_text + "\n" + stderr_text
+            proc = subprocess.run(cmd, env=env, capture_output=True)
+            output_text = _decode_output(proc.stdout) + "\n" + _decode_output(proc.stderr)
             logs.extend([line for line in output_text.strip().splitlines() if line.strip()])
             seen_sig = extract_last_execute_signature(output_text)
             if seen_sig:
@@ -1575,6 +1669,9 @@ def cmd_invoke(
         )
     except Exception as exc:
         return CommandResult(success=False, message=str(exc))
+    finally:
+        if mapped_path is not None:
+            mapped_path.unlink(missing_ok=True)
 
 
 # ── Train ────────────────────────────────────────────────────────
@@ -9,21 +9,32 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widget import Widget
 from textual.widgets import Button, Input, Static
 
-from ..commands import cmd_accounts_show, cmd_accounts_init, cmd_accounts_create, cmd_accounts_close_vm
+from ..commands import (
+    CommandResult,
+    cmd_accounts_show,
+    cmd_accounts_init,
+    cmd_accounts_create,
+    cmd_accounts_close_vm,
+)
 from ..registry import register_project
 from ..runtime import resolve_runtime_context
+from ..widgets.background import BackgroundCommandMixin
 from ..widgets.command_list import CommandItem, CommandList
+from ..widgets.int_input import IntInput
 
 
-_COMMANDS = [
+_COMMANDS = (
     CommandItem("Show Accounts", "show", "Display account mapping and PDAs"),
     CommandItem("Init Accounts", "init", "Generate accounts configuration"),
     CommandItem("Create Accounts", "create", "Allocate accounts on-chain"),
     CommandItem("Close VM", "close-vm", "Close VM PDA and drain lamports"),
-]
+)
 
+_DEFAULT_RAM_COUNT = 1
+_DEFAULT_RAM_BYTES = 262144
 
-class AccountsPanel(Widget):
+
+class AccountsPanel(BackgroundCommandMixin, Widget):
     """Panel for Solana account management."""
 
     DEFAULT_CSS = """
@@ -48,6 +59,15 @@ class AccountsPanel(Widget):
     }
     """
 
+    _worker_group = "accounts-rpc"
+    _busy_message = "[#ffaa00]Another accounts command is still running[/]"
+    # Log panel of the hosting screen, resolved on first use.
+    _log = None
+    _log_resolved = False
+    # Parsed init-form values, kept current by on_input_changed.
+    _ram_count: int | None = _DEFAULT_RAM_COUNT
+    _ram_bytes: int | None = _DEFAULT_RAM_BYTES
+
     def compose(self) -> ComposeResult:
         with Vertical(classes="panel"):
             yield Static("[#00ffcc bold]ACCOUNTS[/]", classes="panel-title")
@@ -56,9 +76,9 @@ class AccountsPanel(Widget):
             # Init form (hidden by default)
             with Vertical(id="accounts-init-form"):
                 yield Static("[#8892a4]RAM segments (1-14)[/]", classes="input-label")
-                yield Input(value="1", id="accounts-ram-count")
+                yield IntInput(_DEFAULT_RAM_COUNT, id="accounts-ram-count")
                 yield Static("[#8892a4]RAM bytes per segment[/]", classes="input-label")
-                yield Input(value="262144", id="accounts-ram-bytes")
+                yield IntInput(_DEFAULT_RAM_BYTES, id="accounts-ram-bytes")
                 with Horizontal(classes="form-row"):
                     yield Button("Create Config", id="btn-accounts-init", variant="primary")
                     yield Button("Cancel", id="btn-accounts-init-cancel")
@@ -66,6 +86,17 @@ class AccountsPanel(Widget):
             with VerticalScroll(id="accounts-result-scroll"):
                 yield Static("", id="accounts-result")
 
+    def on_mount(self) -> None:
+        self._command_list = self.query_one("#accounts-commands", CommandList)
+        self._init_form = self.query_one("#accounts-init-form", Vertical)
+        self._ram_count_input = self.query_one("#accounts-ram-count", IntInput)
+        self._ram_bytes_input = self.query_one("#accounts-ram-bytes", IntInput)
+        self._result = self.query_one("#accounts-result", Static)
+
+    def on_unmount(self) -> None:
+        self._log = None
+        self._log_resolved = False
+
     def on_command_list_selected(self, event: CommandList.Selected) -> None:
         app_state = self.app.app_state  # type: ignore[attr-defined]
         proj = app_state.active_project
@@ -91,43 +122,33 @@ class AccountsPanel(Widget):
         elif event.button.id == "btn-accounts-init-cancel":
             self._hide_init_form()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input is self._ram_count_input:
+            self._ram_count = self._ram_count_input.changed_value(event)
+        elif event.input is self._ram_bytes_input:
+            self._ram_bytes = self._ram_bytes_input.changed_value(event)
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         input_id = event.input.id or ""
         if input_id == "accounts-ram-count":
-            self._focus_field("#accounts-ram-bytes")
+            self._focus_field(self._ram_bytes_input)
         elif input_id == "accounts-ram-bytes":
             self._run_init()
 
     def _show_init_form(self) -> None:
         self._set_command_compact(True)
-        try:
-            self.query_one("#accounts-init-form").add_class("-visible")
-            self.call_after_refresh(self._focus_field, "#accounts-ram-count")
-        except Exception:
-            pass
+        self._init_form.add_class("-visible")
+        self.call_after_refresh(self._focus_field, self._ram_count_input)
 
     def _hide_init_form(self) -> None:
-        try:
-            self.query_one("#accounts-init-form").remove_class("-visible")
-        except Exception:
-            pass
+        self._init_form.remove_class("-visible")
         self._set_command_compact(False)
 
-    def _focus_field(self, selector: str) -> None:
-        try:
-            self.query_one(selector, Input).focus()
-        except Exception:
-            pass
+    def _focus_field(self, field: Input) -> None:
+        field.focus()
 
     def _set_command_compact(self, compact: bool) -> None:
-        try:
-            command_list = self.query_one("#accounts-commands")
-            if compact:
-                command_list.add_class("-compact")
-            else:
-                command_list.remove_class("-compact")
-        except Exception:
-            pass
+        self._command_list.set_class(compact, "-compact")
 
     def _run_init(self) -> None:
         app_state = self.app.app_state  # type: ignore[attr-defined]
@@ -136,26 +157,50 @@ class AccountsPanel(Widget):
             self._show_result("[#ff3366]No active project[/]")
             return
 
-        try:
-            ram_count = int(self.query_one("#accounts-ram-count", Input).value.strip() or "1")
-            ram_bytes = int(self.query_one("#accounts-ram-bytes", Input).value.strip() or "262144")
-        except ValueError:
+        ram_count, ram_bytes = self._ram_count, self._ram_bytes
+        if ram_count is None or ram_bytes is None:
             self._show_result("[#ff3366]Invalid number[/]")
             return
 
-        self._show_result("[#ffaa00]Generating accounts...[/]")
-        self._log_info("Initializing accounts config...")
-        runtime = resolve_runtime_context(proj)
-
-        result = cmd_accounts_init(
-            manifest_path=proj.manifest_path,
-            ram_count=ram_count,
-            ram_bytes=ram_bytes,
-            rpc_url=runtime.rpc_url,
-            program_id=runtime.program_id,
-            payer=runtime.payer,
-            project_path=proj.path,
-        )
+        runtime = None
+
+        def run() -> CommandResult:
+            nonlocal runtime
+            runtime = resolve_runtime_context(proj)
+            return cmd_accounts_init(
+                manifest_path=proj.manifest_path,
+                ram_count=ram_count,
+                ram_bytes=ram_bytes,
+                rpc_url=runtime.rpc_url,
+                program_id=runtime.program_id,
+                payer=runtime.payer,
+                project_path=proj.path,
+            )
+
+        def done(result: CommandResult) -> None:
+            # Project state is shared with the UI, so it is only updated here,
+            # back on the UI thread.
+            if result.success and runtime is not None:
+                path = result.data.get("path")
+                if path:
+                    # Update project accounts path
+                    proj.accounts_path = Path(path)
+                proj.cluster = runtime.cluster
+                proj.rpc_url = runtime.rpc_url
+                proj.program_id = runtime.program_id
+                proj.payer = runtime.payer
+                try:
+                    register_project(proj)
+                except Exception as exc:
+                    result = CommandResult(success=False, message=f"Accounts created, but saving the project failed: {exc}")
+            self._finish_init(result)
+
+        started = self._run_in_background(run, done)
+        if started:
+            self._show_result("[#ffaa00]Generating accounts...[/]")
+            self._log_info("Initializing accounts config...")
+
+    def _finish_init(self, result: CommandResult) -> None:
         if result.success:
             lines = [f"[#39ff14]{result.message}[/]"]
             seed = result.data.get("vm_seed")
@@ -164,13 +209,6 @@ class AccountsPanel(Widget):
             path = result.data.get("path")
             if path:
                 lines.append(f"  [#8892a4]file:[/] {path}")
-                # Update project accounts path
-                proj.accounts_path = Path(path)
-            proj.cluster = runtime.cluster
-            proj.rpc_url = runtime.rpc_url
-            proj.program_id = runtime.program_id
-            proj.payer = runtime.payer
-            register_project(proj)
             self._show_result("\n".join(lines))
             self._log_success(result.message)
             self._hide_init_form()
@@ -186,15 +224,13 @@ class AccountsPanel(Widget):
         if result.success:
             info = result.data.get("info", {})
             mapped = result.data.get("mapped", [])
-            lines = ["[#00ffcc]Account Mapping[/]"]
-            for k, v in info.items():
-                if v is not None:
-                    lines.append(f"  [#8892a4]{k}:[/] {v}")
+            lines = [
+                "[#00ffcc]Account Mapping[/]",
+                *(f"  [#8892a4]{k}:[/] {v}" for k, v in info.items() if v is not None),
+            ]
             if mapped:
-                lines.append("")
-                lines.append("[#00ffcc]Segments[/]")
-                for i, m in enumerate(mapped):
-                    lines.append(f"  [#555e6e]seg {i + 1}:[/] {m}")
+                lines += ["", "[#00ffcc]Segments[/]"]
+                lines += (f"  [#555e6e]seg {i}:[/] {m}" for i, m in enumerate(mapped, 1))
             self._show_result("\n".join(lines))
             self._log_success("Accounts loaded")
         else:
@@ -206,73 +242,72 @@ class AccountsPanel(Widget):
             self._show_result("[#ffaa00]No accounts file. Run 'Init Accounts' first.[/]")
             return
 
-        self._show_result("[#ffaa00]Creating accounts on-chain...[/]")
-        self._log_info("Creating PDA accounts...")
-        runtime = resolve_runtime_context(proj)
-
-        result = cmd_accounts_create(
-            accounts_path=proj.accounts_path,
-            rpc_url=runtime.rpc_url,
-            program_id=runtime.program_id,
-            payer=runtime.payer,
-            project_path=proj.path,
-        )
-        if result.success:
-            lines = [f"[#39ff14]{result.message}[/]"]
-            for log_line in result.logs:
-                lines.append(f"  [#8892a4]{log_line}[/]")
-            self._show_result("\n".join(lines))
-            self._log_success(result.message)
-        else:
-            lines = [f"[#ff3366]{result.message}[/]"]
-            for log_line in result.logs:
-                lines.append(f"  [#8892a4]{log_line}[/]")
-            self._show_result("\n".join(lines))
-            self._log_error(result.message)
+        def run() -> CommandResult:
+            runtime = resolve_runtime_context(proj)
+            return cmd_accounts_create(
+                accounts_path=proj.accounts_path,
+                rpc_url=runtime.rpc_url,
+                program_id=runtime.program_id,
+                payer=runtime.payer,
+                project_path=proj.path,
+            )
+
+        started = self._run_in_background(run, self._show_command_result)
+        if started:
+            self._show_result("[#ffaa00]Creating accounts on-chain...[/]")
+            self._log_info("Creating PDA accounts...")
 
     def _run_close_vm(self, proj) -> None:
         if not proj.accounts_path or not proj.accounts_path.exists():
             self._show_result("[#ffaa00]No accounts file.[/]")
             return
 
-        self._show_result("[#ffaa00]Closing VM...[/]")
-        self._log_info("Closing VM PDA...")
-        runtime = resolve_runtime_context(proj)
-
-        result = cmd_accounts_close_vm(
-            accounts_path=proj.accounts_path,
-            rpc_url=runtime.rpc_url,
-            program_id=runtime.program_id,
-            payer=runtime.payer,
+        def run() -> CommandResult:
+            runtime = resolve_runtime_context(proj)
+            return cmd_accounts_close_vm(
+                accounts_path=proj.accounts_path,
+                rpc_url=runtime.rpc_url,
+                program_id=runtime.program_id,
+                payer=runtime.payer,
+            )
+
+        started = self._run_in_background(run, self._show_command_result)
+        if started:
+            self._show_result("[#ffaa00]Closing VM...[/]")
+            self._log_info("Closing VM PDA...")
+
+    def _show_command_result(self, result: CommandResult) -> None:
+        color = "#39ff14" if result.success else "#ff3366"
+        self._show_result(
+            "\n".join(
+                [f"[{color}]{result.message}[/]"]
+                + [f"  [#8892a4]{log_line}[/]" for log_line in result.logs]
+            )
         )
         if result.success:
-            lines = [f"[#39ff14]{result.message}[/]"]
-            for log_line in result.logs:
-                lines.append(f"  [#8892a4]{log_line}[/]")
-            self._show_result("\n".join(lines))
             self._log_success(result.message)
         else:
-            lines = [f"[#ff3366]{result.message}[/]"]
-            for log_line in result.logs:
-                lines.append(f"  [#8892a4]{log_line}[/]")
-            self._show_result("\n".join(lines))
             self._log_error(result.message)
 
+    def _report_busy(self, text: str) -> None:
+        self._show_result(text)
+
     def _show_result(self, text: str) -> None:
-        try:
-            self.query_one("#accounts-result", Static).update(text)
-        except Exception:
-            pass
+        self._result.update(text)
 
     def _get_log(self):
+        # A mounted panel never changes screens, so resolve the log once.
+        if self._log_resolved:
+            return self._log
         try:
             from ..screens.manual import ManualScreen
             screen = self.screen
             if isinstance(screen, ManualScreen):
-                return screen.get_log()
+                self._log = screen.get_log()
         except Exception:
-            pass
-        return None
+            return None
+        self._log_resolved = True
+        return self._log
 
     def _log_success(self, msg: str) -> None:
         log = self._get_log()
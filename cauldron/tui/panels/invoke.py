@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
@@ -10,23 +11,28 @@ from textual.widget import Widget
 from textual.widgets import Button, Checkbox, Input, Static
 
 from ..commands import (
+    CommandResult,
     cmd_input_write,
     cmd_invoke,
     cmd_output,
 )
 from ..runtime import resolve_runtime_context
+from ..widgets.background import BackgroundCommandMixin
 from ..widgets.command_list import CommandItem, CommandList
+from ..widgets.int_input import IntInput
 from ..widgets.output_viewer import OutputViewer
 
 
-_COMMANDS = [
+_COMMANDS = (
     CommandItem("Write Input", "input-write", "Stage input data to VM"),
     CommandItem("Invoke", "invoke", "Execute inference on-chain"),
     CommandItem("Read Output", "output", "Read inference output from VM"),
-]
+)
+
+_DEFAULT_INSTRUCTIONS = 50000
 
 
-class InvokePanel(Widget):
+class InvokePanel(BackgroundCommandMixin, Widget):
     """Panel for on-chain inference operations."""
 
     DEFAULT_CSS = """
@@ -44,21 +50,30 @@ class InvokePanel(Widget):
     InvokePanel #invoke-run-form {
         height: auto;
         padding: 1 0;
-        display: none;
-    }
-    InvokePanel #invoke-input-form.-visible,
-    InvokePanel #invoke-run-form.-visible {
-        display: block;
     }
     InvokePanel #invoke-output {
         margin-top: 1;
+    }
+    InvokePanel #invoke-input-form,
+    InvokePanel #invoke-run-form,
+    InvokePanel #invoke-output {
         display: none;
     }
+    InvokePanel #invoke-input-form.-visible,
+    InvokePanel #invoke-run-form.-visible,
     InvokePanel #invoke-output.-visible {
         display: block;
     }
     """
 
+    _worker_group = "invoke-rpc"
+    _busy_message = "[#ffaa00]Another invoke command is still running[/]"
+    # Log panel of the hosting screen, resolved on first use.
+    _log = None
+    _log_resolved = False
+    # Parsed instructions budget, kept current by on_input_changed.
+    _instructions: int | None = _DEFAULT_INSTRUCTIONS
+
     def compose(self) -> ComposeResult:
         with Vertical(classes="panel", id="invoke-shell"):
             yield Static("[#00ffcc bold]INVOKE[/]", classes="panel-title")
@@ -81,7 +96,7 @@ class InvokePanel(Widget):
                         "[#8892a4]Instructions budget (press Enter on Invoke to run)[/]",
                         classes="input-label",
                     )
-                    yield Input(value="50000", id="invoke-instructions")
+                    yield IntInput(_DEFAULT_INSTRUCTIONS, id="invoke-instructions")
                     with Horizontal(classes="form-row"):
                         yield Checkbox("Fast mode (skip sim)", id="invoke-fast", value=False)
                     with Horizontal(classes="form-row"):
@@ -90,6 +105,29 @@ class InvokePanel(Widget):
 
                 yield OutputViewer(id="invoke-output")
 
+    def on_mount(self) -> None:
+        self._command_list = self.query_one("#invoke-commands", CommandList)
+        self._detail_scroll = self.query_one("#invoke-detail-scroll", VerticalScroll)
+        self._output_viewer = self.query_one("#invoke-output", OutputViewer)
+        self._data_path_input = self.query_one("#invoke-data-path", Input)
+        self._header_checkbox = self.query_one("#invoke-header", Checkbox)
+        self._crc_checkbox = self.query_one("#invoke-crc", Checkbox)
+        self._instructions_input = self.query_one("#invoke-instructions", IntInput)
+        self._fast_checkbox = self.query_one("#invoke-fast", Checkbox)
+        self._forms = {
+            "invoke-input-form": self.query_one("#invoke-input-form", Vertical),
+            "invoke-run-form": self.query_one("#invoke-run-form", Vertical),
+        }
+        self._focus_targets = {
+            "invoke-input-form": self._data_path_input,
+            # Focus primary action to make Enter immediately actionable.
+            "invoke-run-form": self.query_one("#btn-invoke-run", Button),
+        }
+
+    def on_unmount(self) -> None:
+        self._log = None
+        self._log_resolved = False
+
     def on_command_list_selected(self, event: CommandList.Selected) -> None:
         app_state = self.app.app_state  # type: ignore[attr-defined]
         proj = app_state.active_project
@@ -114,6 +152,10 @@ class InvokePanel(Widget):
         elif btn in ("btn-input-cancel", "btn-invoke-cancel"):
             self._hide_all_forms()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input is self._instructions_input:
+            self._instructions = self._instructions_input.changed_value(event)
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         widget_id = event.input.id or ""
         if widget_id == "invoke-data-path":
@@ -125,57 +167,29 @@ class InvokePanel(Widget):
         self._hide_all_forms()
         self._set_command_compact(True)
         self._set_output_visible(False)
-        try:
-            self.query_one(f"#{form_id}").add_class("-visible")
-            self.call_after_refresh(self._focus_visible_form_control, form_id)
-        except Exception:
-            pass
+        self._forms[form_id].add_class("-visible")
+        self.call_after_refresh(self._focus_visible_form_control, form_id)
 
     def _hide_all_forms(self) -> None:
-        for fid in ("invoke-input-form", "invoke-run-form"):
-            try:
-                self.query_one(f"#{fid}").remove_class("-visible")
-            except Exception:
-                pass
+        for form in self._forms.values():
+            form.remove_class("-visible")
         self._set_command_compact(False)
 
     def _focus_visible_form_control(self, form_id: str) -> None:
-        focus_target = {
-            "invoke-input-form": "invoke-data-path",
-            # Focus primary action to make Enter immediately actionable.
-            "invoke-run-form": "btn-invoke-run",
-        }.get(form_id)
-        if not focus_target:
+        target = self._focus_targets.get(form_id)
+        if target is None:
             return
-        try:
-            target = self.query_one(f"#{focus_target}")
-            target.focus()
-            detail = self.query_one("#invoke-detail-scroll", VerticalScroll)
-            detail.scroll_to_widget(target, animate=False, top=True)
-        except Exception:
-            pass
+        target.focus()
+        self._detail_scroll.scroll_to_widget(target, animate=False, top=True)
 
     def _set_output_visible(self, visible: bool) -> None:
-        try:
-            viewer = self.query_one("#invoke-output", OutputViewer)
-            if visible:
-                viewer.add_class("-visible")
-                detail = self.query_one("#invoke-detail-scroll", VerticalScroll)
-                detail.scroll_to_widget(viewer, animate=False, top=False)
-            else:
-                viewer.remove_class("-visible")
-        except Exception:
-            pass
+        viewer = self._output_viewer
+        viewer.set_class(visible, "-visible")
+        if visible:
+            self._detail_scroll.scroll_to_widget(viewer, animate=False, top=False)
 
     def _set_command_compact(self, compact: bool) -> None:
-        try:
-            command_list = self.query_one("#invoke-commands")
-            if compact:
-                command_list.add_class("-compact")
-            else:
-                command_list.remove_class("-compact")
-        except Exception:
-            pass
+        self._command_list.set_class(compact, "-compact")
 
     def _run_input_write(self) -> None:
         proj = self.app.app_state.active_project  # type: ignore[attr-defined]
@@ -183,7 +197,7 @@ class InvokePanel(Widget):
             self._notify("[#ff3366]No accounts file[/]")
             return
 
-        data_val = self.query_one("#invoke-data-path", Input).value.strip()
+        data_val = self._data_path_input.value.strip()
         if not data_val:
             self._notify("[#ff3366]Enter data file path[/]")
             return
@@ -192,21 +206,27 @@ class InvokePanel(Widget):
         if not data_path.is_absolute():
             data_path = proj.manifest_path.parent / data_path
 
-        include_header = self.query_one("#invoke-header", Checkbox).value
-        include_crc = self.query_one("#invoke-crc", Checkbox).value
-        runtime = resolve_runtime_context(proj)
-
-        self._log_info(f"Writing input from {data_path.name}...")
-        result = cmd_input_write(
-            manifest_path=proj.manifest_path,
-            accounts_path=proj.accounts_path,
-            data_path=data_path,
-            include_header=include_header,
-            include_crc=include_crc,
-            rpc_url=runtime.rpc_url,
-            payer=runtime.payer,
-            program_id=runtime.program_id,
-        )
+        include_header = self._header_checkbox.value
+        include_crc = self._crc_checkbox.value
+
+        def run() -> CommandResult:
+            runtime = resolve_runtime_context(proj)
+            return cmd_input_write(
+                manifest_path=proj.manifest_path,
+                accounts_path=proj.accounts_path,
+                data_path=data_path,
+                include_header=include_header,
+                include_crc=include_crc,
+                rpc_url=runtime.rpc_url,
+                payer=runtime.payer,
+                program_id=runtime.program_id,
+            )
+
+        started = self._run_in_background(run, self._finish_input_write)
+        if started:
+            self._log_info(f"Writing input from {data_path.name}...")
+
+    def _finish_input_write(self, result: CommandResult) -> None:
         if result.success:
             self._log_success(result.message)
             self._notify(f"[#39ff14]{result.message}[/]")
@@ -221,37 +241,40 @@ class InvokePanel(Widget):
             self._notify("[#ff3366]No accounts file[/]")
             return
 
-        try:
-            instructions = int(self.query_one("#invoke-instructions", Input).value.strip() or "50000")
-        except ValueError:
+        instructions = self._instructions
+        if instructions is None:
             self._notify("[#ff3366]Invalid instructions value[/]")
             return
 
-        fast = self.query_one("#invoke-fast", Checkbox).value
-        runtime = resolve_runtime_context(proj)
-
-        self._log_info("Invoking inference on-chain...")
-        result = cmd_invoke(
-            accounts_path=proj.accounts_path,
-            instructions=instructions,
-            fast=fast,
-            rpc_url=runtime.rpc_url,
-            payer=runtime.payer,
-            program_id=runtime.program_id,
-        )
+        fast = self._fast_checkbox.value
+
+        def run() -> CommandResult:
+            runtime = resolve_runtime_context(proj)
+            return cmd_invoke(
+                accounts_path=proj.accounts_path,
+                instructions=instructions,
+                fast=fast,
+                rpc_url=runtime.rpc_url,
+                payer=runtime.payer,
+                program_id=runtime.program_id,
+            )
+
+        started = self._run_in_background(run, self._finish_invoke)
+        if started:
+            self._log_info("Invoking inference on-chain...")
+
+    def _finish_invoke(self, result: CommandResult) -> None:
         if result.success:
             self._log_success(result.message)
             sig = result.data.get("signature")
             if sig:
                 self._log_info(f"  signature: {sig}")
-            for line in result.logs:
-                self._log_info(f"  {line}")
+            self._log_info_lines(f"  {line}" for line in result.logs)
             self._notify(f"[#39ff14]{result.message}[/]")
             self._hide_all_forms()
         else:
             self._log_error(result.message)
-            for line in result.logs:
-                self._log_error(f"  {line}")
+            self._log_error_lines(f"  {line}" for line in result.logs)
             self._notify(f"[#ff3366]{result.message}[/]")
 
     def _run_output(self, proj) -> None:
@@ -259,17 +282,22 @@ class InvokePanel(Widget):
             self._notify("[#ffaa00]No accounts file. Set up accounts first.[/]")
             return
 
-        self._log_info("Reading output...")
-        runtime = resolve_runtime_context(proj)
-        result = cmd_output(
-            manifest_path=proj.manifest_path,
-            accounts_path=proj.accounts_path,
-            rpc_url=runtime.rpc_url,
-        )
+        def run() -> CommandResult:
+            runtime = resolve_runtime_context(proj)
+            return cmd_output(
+                manifest_path=proj.manifest_path,
+                accounts_path=proj.accounts_path,
+                rpc_url=runtime.rpc_url,
+            )
+
+        started = self._run_in_background(run, self._finish_output)
+        if started:
+            self._log_info("Reading output...")
+
+    def _finish_output(self, result: CommandResult) -> None:
         if result.success:
             try:
-                viewer = self.query_one("#invoke-output", OutputViewer)
-                viewer.display_output(result.data)
+                self._output_viewer.display_output(result.data)
                 self._set_output_visible(True)
             except Exception:
                 pass
@@ -278,6 +306,9 @@ class InvokePanel(Widget):
             self._notify(f"[#ff3366]{result.message}[/]")
             self._log_error(result.message)
 
+    def _report_busy(self, text: str) -> None:
+        self._notify(text)
+
     def _notify(self, text: str) -> None:
         try:
             self.app.notify(text)
@@ -285,14 +316,18 @@ class InvokePanel(Widget):
             pass
 
     def _get_log(self):
+        # A mounted panel never changes screens, so resolve the log once.
+        if self._log_resolved:
+            return self._log
         try:
             from ..screens.manual import ManualScreen
             screen = self.screen
             if isinstance(screen, ManualScreen):
-                return screen.get_log()
+                self._log = screen.get_log()
         except Exception:
-            pass
-        return None
+            return None
+        self._log_resolved = True
+        return self._log
 
     def _log_success(self, msg: str) -> None:
         log = self._get_log()
@@ -308,3 +343,13 @@ class InvokePanel(Widget):
         log = self._get_log()
         if log:
             log.log_info(msg)
+
+    def _log_info_lines(self, lines: Iterable[str]) -> None:
+        log = self._get_log()
+        if log:
+            log.log_info_lines(lines)
+
+    def _log_error_lines(self, lines: Iterable[str]) -> None:
+        log = self._get_log()
+        if log:
+            log.log_error_lines(lines)
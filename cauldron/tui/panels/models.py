@@ -24,14 +24,14 @@ from ..runtime import resolve_runtime_context
 from ..widgets.command_list import CommandItem, CommandList
 
 
-_COMMANDS = [
+_COMMANDS = (
     CommandItem("Initialize Project", "initialize", "Validate manifest + generate accounts config"),
     CommandItem("Validate Manifest", "validate", "Check manifest against spec"),
     CommandItem("Show Manifest", "show", "Display manifest sections"),
     CommandItem("Build Guest", "build-guest", "Compile RISC-V guest program"),
     CommandItem("Upload Guest Program", "upload-guest", "Load compiled guest ELF into VM"),
     CommandItem("Schema Hash", "schema-hash", "Compute schema hash"),
-]
+)
 
 
 class ModelsPanel(Widget):
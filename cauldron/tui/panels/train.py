@@ -13,9 +13,9 @@ from ..commands import cmd_train
 from ..widgets.command_list import CommandItem, CommandList
 
 
-_COMMANDS = [
+_COMMANDS = (
     CommandItem("Train Model", "train", "Train from data using the manifest template"),
-]
+)
 
 
 class TrainPanel(Widget):
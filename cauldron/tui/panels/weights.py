@@ -14,12 +14,12 @@ from ..runtime import resolve_runtime_context
 from ..widgets.command_list import CommandItem, CommandList
 
 
-_COMMANDS = [
+_COMMANDS = (
     CommandItem("Convert Weights", "convert", "Convert weights to binary format"),
     CommandItem("Pack Manifest", "pack", "Hash weights and update manifest"),
     CommandItem("Chunk Weights", "chunk", "Split weights for upload"),
     CommandItem("Upload Weights", "upload", "Upload chunk(s) to on-chain weights account"),
-]
+)
 
 
 class WeightsPanel(Widget):
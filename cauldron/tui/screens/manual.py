@@ -8,7 +8,7 @@ from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import ContentSwitcher, Footer, Static
 
-from ..agent_context import copy_text_to_clipboard, render_agent_context, write_agent_context
+from ..agent_context import context_stamps, copy_text_to_clipboard, render_agent_context, write_agent_context
 from ..widgets.header import CauldronHeader
 from ..widgets.log_panel import LogPanel
 from ..widgets.sidebar import Sidebar
@@ -164,8 +164,9 @@ class ManualScreen(Screen):
             self.app.notify("No active project", severity="warning")
             return
         payload = self.export_agent_context_payload()
-        context_text = render_agent_context(project=proj, **payload)
-        out_path = write_agent_context(proj.path, context_text)
+        now_iso, stamp = context_stamps()
+        context_text = render_agent_context(project=proj, now_iso=now_iso, **payload)
+        out_path = write_agent_context(proj, context_text, stamp=stamp)
         copied, tool_msg = copy_text_to_clipboard(context_text)
         if copied:
             self.app.notify(f"Agent context saved and copied ({tool_msg})", severity="information")
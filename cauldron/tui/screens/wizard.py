@@ -14,7 +14,7 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Button, Static
 
-from ..agent_context import copy_text_to_clipboard, render_agent_context, write_agent_context
+from ..agent_context import context_stamps, copy_text_to_clipboard, render_agent_context, write_agent_context
 from ..commands import (
     cmd_accounts_create,
     cmd_accounts_init,
@@ -994,8 +994,9 @@ class WizardScreen(Screen):
             self.notify("No active project", severity="warning")
             return
         payload = self.export_agent_context_payload()
-        context_text = render_agent_context(project=project, **payload)
-        out_path = write_agent_context(project.path, context_text)
+        now_iso, stamp = context_stamps()
+        context_text = render_agent_context(project=project, now_iso=now_iso, **payload)
+        out_path = write_agent_context(project, context_text, stamp=stamp)
         self._generated_context_path = out_path
         copied, tool_msg = copy_text_to_clipboard(context_text)
         if copied:
@@ -22,6 +22,18 @@ class ProjectInfo:
     payer: str | None = None
     last_activity: str | None = None
     deployment_state: str = "init"
+    _context_dir: Path | None = field(default=None, init=False, repr=False, compare=False)
+    _context_dir_base: Path | None = field(default=None, init=False, repr=False, compare=False)
+    _ctx_dir_ready: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def context_dir(self) -> Path:
+        """Project-local `.cauldron/context/` directory, rebuilt only if `path` is reassigned."""
+        if self._context_dir is None or self._context_dir_base is not self.path:
+            self._context_dir = self.path / ".cauldron" / "context"
+            self._context_dir_base = self.path
+            self._ctx_dir_ready = False
+        return self._context_dir
 
 
 @dataclass
@@ -0,0 +1,55 @@
+"""BackgroundCommandMixin — run blocking panel commands off the UI thread."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from ..commands import CommandResult
+
+
+class BackgroundCommandMixin:
+    """Run one blocking ``cmd_*`` call at a time on a worker thread.
+
+    Mix into a ``Widget``. Subclasses name their worker group and busy text,
+    and override ``_report_busy`` to show it where the panel reports results.
+    """
+
+    # Worker group for run_worker; one per panel type.
+    _worker_group = "panel-command"
+    _busy_message = "[#ffaa00]Another command is still running[/]"
+    # Set while a command runs on a worker thread.
+    _busy = False
+
+    def _report_busy(self, text: str) -> None:
+        self.app.notify(text)  # type: ignore[attr-defined]
+
+    def _run_in_background(
+        self,
+        call: Callable[[], CommandResult],
+        done: Callable[[CommandResult], None],
+    ) -> bool:
+        """Run a blocking ``cmd_*`` call on a worker thread.
+
+        ``done`` receives the result back on the UI thread. Returns False
+        without starting anything while another command is still running.
+        """
+        if self._busy:
+            self._report_busy(self._busy_message)
+            return False
+        self._busy = True
+
+        def work() -> None:
+            try:
+                result = call()
+            except Exception as exc:
+                result = CommandResult(success=False, message=str(exc))
+            self.app.call_from_thread(self._finish_background, done, result)  # type: ignore[attr-defined]
+
+        self.run_worker(work, thread=True, group=self._worker_group)  # type: ignore[attr-defined]
+        return True
+
+    def _finish_background(self, done: Callable[[CommandResult], None], result: CommandResult) -> None:
+        self._busy = False
+        # Result text, form state and log lines land in one screen update.
+        with self.app.batch_update():  # type: ignore[attr-defined]
+            done(result)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Sequence
 
 from textual.app import ComposeResult
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import OptionList
 from textual.widgets.option_list import Option
@@ -21,7 +23,13 @@ class CommandItem:
 
 
 class CommandList(Widget):
-    """Arrow-key navigable list of commands. Fires Selected on Enter."""
+    """Arrow-key navigable list of commands. Fires Selected on Enter.
+
+    Activations arriving within ``SELECT_DEBOUNCE`` seconds of each other
+    (key repeat, double Enter) collapse into one Selected for the last key.
+    """
+
+    SELECT_DEBOUNCE = 0.03
 
     DEFAULT_CSS = """
     CommandList {
@@ -37,14 +45,26 @@ class CommandList(Widget):
             super().__init__()
             self.key = key
 
-    def __init__(self, commands: list[CommandItem], **kwargs) -> None:
+    def __init__(self, commands: Sequence[CommandItem], **kwargs) -> None:
         super().__init__(**kwargs)
         self._commands = commands
+        self._pending_key: str | None = None
+        self._select_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         options = [Option(cmd.label, id=cmd.key) for cmd in self._commands]
         yield OptionList(*options)
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
-        if event.option.id:
-            self.post_message(self.Selected(event.option.id))
+        if not event.option.id:
+            return
+        self._pending_key = event.option.id
+        if self._select_timer is not None:
+            self._select_timer.stop()
+        self._select_timer = self.set_timer(self.SELECT_DEBOUNCE, self._flush_selection)
+
+    def _flush_selection(self) -> None:
+        key, self._pending_key = self._pending_key, None
+        self._select_timer = None
+        if key:
+            self.post_message(self.Selected(key))
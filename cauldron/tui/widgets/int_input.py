@@ -0,0 +1,25 @@
+"""IntInput — integer field validated by Textual."""
+
+from __future__ import annotations
+
+from textual.widgets import Input
+
+
+class IntInput(Input):
+    """Integer-only Input whose ``-invalid`` class is managed by Textual.
+
+    ``type="integer"`` installs Textual's Integer validator, which runs on
+    change, blur and submit. An empty field is valid and stands for
+    ``default``.
+    """
+
+    def __init__(self, default: int, *, id: str | None = None) -> None:
+        super().__init__(value=str(default), type="integer", valid_empty=True, id=id)
+        self.default = default
+
+    def changed_value(self, event: Input.Changed) -> int | None:
+        """Integer carried by a Changed event, or None if it failed validation."""
+        result = event.validation_result
+        if result is not None and not result.is_valid:
+            return None
+        return int(event.value or self.default)
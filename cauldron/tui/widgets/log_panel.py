@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Iterable
+
 from rich.markup import escape
 from textual.widgets import RichLog
 
@@ -28,6 +30,19 @@ class LogPanel(RichLog):
     def log_info(self, message: str) -> None:
         self.write(f"[#8892a4]{escape(message)}[/]")
 
+    def log_info_lines(self, messages: Iterable[str]) -> None:
+        """Write several info lines with a single render and scroll."""
+        self._write_lines("#8892a4", messages)
+
+    def log_error_lines(self, messages: Iterable[str]) -> None:
+        """Write several error lines with a single render and scroll."""
+        self._write_lines("#ff3366", messages)
+
+    def _write_lines(self, color: str, messages: Iterable[str]) -> None:
+        text = "\n".join(messages)
+        if text:
+            self.write(f"[{color}]{escape(text)}[/]")
+
     def log_success(self, message: str) -> None:
         self.write(f"[#39ff14]{escape(message)}[/]")
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+from .helpers import RUST_TOOLS_DIR, rust_tool_command
+
 
 def upload_model_chunk(
     chunk_path: Path,
@@ -13,12 +15,11 @@ def upload_model_chunk(
 ) -> int:
     if not chunk_path.exists():
         raise FileNotFoundError(f"Chunk not found: {chunk_path}")
-    rust_tools = Path(__file__).resolve().parent / "rust_tools"
     chunk_path = chunk_path.resolve()
-    cmd = ["cargo", "run", "--bin", "upload_model", "--", str(chunk_path)]
+    cmd = [*rust_tool_command("upload_model"), str(chunk_path)]
     if extra_args:
         cmd.extend(extra_args)
-    return subprocess.call(cmd, env=env, cwd=str(rust_tools))
+    return subprocess.call(cmd, env=env, cwd=str(RUST_TOOLS_DIR))
 
 
 def upload_all_chunks(
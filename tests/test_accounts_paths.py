@@ -1,4 +1,6 @@
+import os
 import subprocess
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -11,6 +13,7 @@ from cauldron.accounts import (
     segment_seed_string,
     vm_seed_string,
 )
+from cauldron.tui import _cache
 
 
 class AccountsPathTests(unittest.TestCase):
@@ -85,6 +88,30 @@ class AccountsPathTests(unittest.TestCase):
         self.assertEqual(called[0:2], ["solana", "create-address-with-seed"])
         self.assertIn("fbv1:sg:0000000000000007:0101", called)
 
+    def test_cached_segment_metas_tracks_keypair_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            accounts_path = Path(tmp) / "accounts.toml"
+            payer_path = Path(tmp) / "payer.json"
+            segment_path = Path(tmp) / "seg1.json"
+            payer_path.write_text("[1]")
+            segment_path.write_text("[2]")
+            accounts_path.write_text(
+                '[cluster]\npayer = "payer.json"\n\n'
+                '[[segments]]\nindex = 1\nkind = "weights"\nkeypair = "seg1.json"\n'
+            )
+            _cache.clear_caches()
+            with patch.object(_cache, "accounts_segment_metas", return_value=({}, [])) as metas:
+                _cache.cached_accounts_segment_metas(accounts_path)
+                _cache.cached_accounts_segment_metas(accounts_path)
+                self.assertEqual(metas.call_count, 1)
+
+                for keypair_path in (payer_path, segment_path):
+                    stat = keypair_path.stat()
+                    os.utime(keypair_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                    _cache.cached_accounts_segment_metas(accounts_path)
+                self.assertEqual(metas.call_count, 3)
+            _cache.clear_caches()
+
 
 if __name__ == "__main__":
     unittest.main()
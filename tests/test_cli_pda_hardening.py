@@ -1,12 +1,15 @@
 import argparse
 import io
+import os
 import struct
+import sys
 import tempfile
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from cauldron import helpers
 from cauldron.accounts import Segment
 from cauldron.cli import (
     _accounts_segment_metas,
@@ -1430,5 +1433,76 @@ class CliPdaHardeningTests(unittest.TestCase):
         self.assertEqual(rc, 0)
 
 
+_STUB_WRITER = """
+import json, sys
+log = open(sys.argv[1], "a")
+for line in sys.stdin:
+    job = json.loads(line)
+    log.write(f"{job['offset']}:{job['hex']}\\n")
+    log.flush()
+    if job["offset"] == 0xBAD:
+        print("err RPC rejected the transaction", flush=True)
+    else:
+        print(f"ok {len(bytes.fromhex(job['hex']))}", flush=True)
+"""
+
+
+class AccountWriterTests(unittest.TestCase):
+    def _writer(self, tmp: str, script: str, *extra: str):
+        script_path = Path(tmp) / "writer.py"
+        script_path.write_text(script)
+        cmd = [sys.executable, str(script_path), *extra]
+        return patch("cauldron.helpers.rust_tool_command", return_value=cmd)
+
+    def test_jobs_run_in_order_and_report_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "jobs.log"
+            with self._writer(tmp, _STUB_WRITER, str(log_path)), redirect_stdout(io.StringIO()):
+                with helpers.account_writer({}, "Vm1111", 512) as write:
+                    self.assertEqual(write(0x100, b"\x01\x02"), (0, ""))
+                    self.assertEqual(write(0xBAD, b"\xff"), (1, "RPC rejected the transaction"))
+                    self.assertEqual(write(0x200, b""), (0, ""))
+            self.assertEqual(log_path.read_text().splitlines(), ["256:0102", "2989:ff", "512:"])
+
+    def test_early_exit_returns_tool_rc(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with self._writer(tmp, "import sys\nsys.exit(3)\n"), redirect_stdout(io.StringIO()):
+                with helpers.account_writer({}, "Vm1111", None) as write:
+                    rc, error = write(0, b"\x00" * 4096)
+        self.assertEqual(rc, 3)
+        self.assertIn("rc=3", error)
+
+    def test_rejects_offset_outside_u32(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "jobs.log"
+            with self._writer(tmp, _STUB_WRITER, str(log_path)), redirect_stdout(io.StringIO()):
+                with helpers.account_writer({}, "Vm1111", None) as write:
+                    with self.assertRaisesRegex(ValueError, "u32"):
+                        write(1 << 32, b"\x00")
+
+
+class RustToolCommandTests(unittest.TestCase):
+    def test_rechecks_freshness_on_every_call(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            source = root / "src" / "bin" / "write_account.rs"
+            source.parent.mkdir(parents=True)
+            source.write_text("fn main() {}\n")
+            (root / "Cargo.toml").write_text("[package]\n")
+            (root / "Cargo.lock").write_text("")
+            binary = root / "target" / "release" / "write_account"
+            binary.parent.mkdir(parents=True)
+            binary.write_text("")
+            mtime_ns = source.stat().st_mtime_ns
+            os.utime(binary, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+            with patch.object(helpers, "RUST_TOOLS_DIR", root), patch.dict(os.environ, {"CARGO_TARGET_DIR": ""}):
+                self.assertEqual(helpers.rust_tool_command("write_account"), [str(binary)])
+                os.utime(source, ns=(mtime_ns, mtime_ns + 2_000_000_000))
+                self.assertEqual(
+                    helpers.rust_tool_command("write_account"),
+                    ["cargo", "run", "--bin", "write_account", "--"],
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import http.client
+import io
+import unittest
+import urllib.error
+from unittest.mock import MagicMock, Mock, patch
+
+from cauldron import helpers
+
+
+def _response(status: int, body: bytes = b"", location: str | None = None) -> Mock:
+    resp = Mock(status=status, reason="Reason")
+    resp.read.return_value = body
+    resp.getheader.side_effect = lambda name: location if name == "Location" else None
+    return resp
+
+
+def _connection(*, reused: bool, responses: list) -> Mock:
+    conn = Mock()
+    conn.sock = object() if reused else None
+    conn.getresponse.side_effect = responses
+    return conn
+
+
+class RpcPostTests(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(helpers.urllib.request, "getproxies", return_value={})
+        self.getproxies = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stale_pooled_connection_is_retried_once_on_fresh_one(self) -> None:
+        stale = _connection(reused=True, responses=[http.client.RemoteDisconnected("closed")])
+        fresh = _connection(reused=False, responses=[_response(200, b"{}")])
+        with patch.object(helpers, "_rpc_connection", side_effect=[stale, fresh]) as get_conn:
+            self.assertEqual(helpers._rpc_post("http://rpc.local/", b"{}"), (200, "Reason", b"{}"))
+        self.assertEqual([c.kwargs["fresh"] for c in get_conn.call_args_list], [False, True])
+        stale.close.assert_called_once()
+
+    def test_failure_on_new_connection_is_not_retried(self) -> None:
+        conn = _connection(reused=False, responses=[ConnectionRefusedError("refused")])
+        with patch.object(helpers, "_rpc_connection", return_value=conn) as get_conn:
+            with self.assertRaises(ConnectionRefusedError):
+                helpers._rpc_post("http://rpc.local/", b"{}")
+        get_conn.assert_called_once()
+
+    def test_redirect_reposts_to_location(self) -> None:
+        first = _connection(reused=False, responses=[_response(308, location="https://rpc2.local/v1")])
+        second = _connection(reused=False, responses=[_response(200, b"{}")])
+        with patch.object(helpers, "_rpc_connection", side_effect=[first, second]) as get_conn:
+            self.assertEqual(helpers._rpc_post("http://rpc.local/", b"{}")[0], 200)
+        self.assertEqual(get_conn.call_args_list[1].args[0].netloc, "rpc2.local")
+        second.request.assert_called_once_with(
+            "POST", "/v1", body=b"{}", headers={"Content-Type": "application/json"}
+        )
+
+    def test_redirect_loop_raises(self) -> None:
+        def loop(*_args, **_kwargs):
+            return _connection(reused=False, responses=[_response(302, location="/again")])
+
+        with patch.object(helpers, "_rpc_connection", side_effect=loop):
+            with self.assertRaisesRegex(ValueError, "redirected more than"):
+                helpers._rpc_post("http://rpc.local/", b"{}")
+
+    def test_redirect_without_location_raises(self) -> None:
+        conn = _connection(reused=False, responses=[_response(301)])
+        with patch.object(helpers, "_rpc_connection", return_value=conn):
+            with self.assertRaisesRegex(ValueError, "no Location header"):
+                helpers._rpc_post("http://rpc.local/", b"{}")
+
+    def test_proxy_configured_uses_urllib(self) -> None:
+        self.getproxies.return_value = {"http": "http://proxy.local:3128"}
+        opener = Mock()
+        opener.open.return_value = MagicMock()
+        opener.open.return_value.__enter__.return_value = _response(200, b"{}")
+        with patch.object(helpers, "_rpc_connection") as get_conn, patch.object(
+            helpers.urllib.request, "build_opener", return_value=opener
+        ):
+            self.assertEqual(helpers._rpc_post("http://rpc.local/", b"{}"), (200, "Reason", b"{}"))
+        get_conn.assert_not_called()
+        self.assertEqual(opener.open.call_args.args[0].full_url, "http://rpc.local/")
+
+    def test_proxy_http_error_is_returned_as_status(self) -> None:
+        self.getproxies.return_value = {"https": "http://proxy.local:3128"}
+        opener = Mock()
+        opener.open.side_effect = urllib.error.HTTPError(
+            "https://rpc.local/", 503, "Unavailable", {}, io.BytesIO(b"")
+        )
+        with patch.object(helpers.urllib.request, "build_opener", return_value=opener):
+            self.assertEqual(helpers._rpc_post("https://rpc.local/", b"{}"), (503, "Unavailable", b""))
+
+
+class RpcRequestRawTests(unittest.TestCase):
+    def test_retry_statuses_are_retried(self) -> None:
+        replies = [(429, "Too Many Requests", b""), (503, "Unavailable", b""), (200, "OK", b'{"result": 5}')]
+        with patch.object(helpers, "_rpc_post", side_effect=replies) as post, patch.object(
+            helpers.time, "sleep"
+        ) as sleep:
+            self.assertEqual(helpers.rpc_request_raw("http://rpc.local/", "getSlot", []), {"result": 5})
+        self.assertEqual(post.call_count, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.25, 0.5])
+
+    def test_other_http_errors_are_not_retried(self) -> None:
+        with patch.object(helpers, "_rpc_post", return_value=(404, "Not Found", b"")) as post, patch.object(
+            helpers.time, "sleep"
+        ):
+            with self.assertRaisesRegex(ValueError, "RPC HTTP error 404"):
+                helpers.rpc_request_raw("http://rpc.local/", "getSlot", [])
+        post.assert_called_once()
+
+    def test_transport_errors_exhaust_retries(self) -> None:
+        with patch.object(helpers, "_rpc_post", side_effect=ConnectionResetError("reset")) as post, patch.object(
+            helpers.time, "sleep"
+        ):
+            with self.assertRaisesRegex(ValueError, "RPC transport error"):
+                helpers.rpc_request_raw("http://rpc.local/", "getSlot", [])
+        self.assertEqual(post.call_count, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import importlib.util
+import io
+import json
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from unittest.mock import Mock, patch
+
+from cauldron.training import cli as training
+
+# numpy ships only with the optional train extra.
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+if _HAS_NUMPY:
+    import numpy as np
+_requires_numpy = unittest.skipUnless(_HAS_NUMPY, "numpy not installed")
+
+
+@_requires_numpy
+class NpzMemberTests(unittest.TestCase):
+    def _load(self, save, **arrays):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data.npz"
+            save(path, **arrays)
+            with np.load(path) as data:
+                members = {key: training._npz_member(data, path, key) for key in arrays}
+                # Materialize before the temp dir goes away.
+                return {key: (type(value), np.array(value)) for key, value in members.items()}
+
+    def test_savez_members_are_memory_mapped(self) -> None:
+        x = np.arange(24, dtype=np.float32).reshape(4, 6)
+        y = np.asfortranarray(np.arange(12, dtype=np.int64).reshape(3, 4))
+        loaded = self._load(np.savez, x=x, y=y)
+        for key, expected in (("x", x), ("y", y)):
+            kind, value = loaded[key]
+            self.assertTrue(issubclass(kind, np.memmap), key)
+            np.testing.assert_array_equal(value, expected)
+
+    def test_savez_compressed_falls_back_to_np_load(self) -> None:
+        x = np.arange(24, dtype=np.float32).reshape(4, 6)
+        kind, value = self._load(np.savez_compressed, x=x)["x"]
+        self.assertFalse(issubclass(kind, np.memmap))
+        np.testing.assert_array_equal(value, x)
+
+    def test_zip64_extra_disagreeing_with_central_directory_falls_back(self) -> None:
+        x = np.arange(8, dtype=np.float64)
+
+        def save_with_bad_extra(path, **arrays):
+            np.savez(path, **arrays)
+            raw = bytearray(path.read_bytes())
+            name_len, extra_len = struct.unpack_from("<HH", raw, 26)
+            extra_at = 30 + name_len
+            self.assertEqual(struct.unpack_from("<H", raw, extra_at)[0], 0x0001)
+            struct.pack_into("<Q", raw, extra_at + 4, 1)
+            path.write_bytes(bytes(raw))
+
+        kind, value = self._load(save_with_bad_extra, x=x)["x"]
+        self.assertFalse(issubclass(kind, np.memmap))
+        np.testing.assert_array_equal(value, x)
+
+
+@_requires_numpy
+class AbsPercentileTests(unittest.TestCase):
+    def _kernels(self):
+        kernels = [training._abs_percentile]
+        compiled = training._abs_percentile_kernel()
+        if compiled is not None:
+            kernels.append(compiled)
+        return kernels
+
+    def test_matches_numpy_percentile(self) -> None:
+        rng = np.random.default_rng(0)
+        cases = [
+            np.array([-3.5]),
+            np.array([2.0, -1.0]),
+            rng.normal(size=7),
+            rng.normal(size=10),
+            np.array([1.0, -1.0, 1.0, 2.0, -2.0, 0.0, 2.0, 1.0, -1.0]),
+            np.round(rng.normal(size=64) * 3),
+            np.full(6, -4.25),
+        ]
+        for kernel in self._kernels():
+            for values in cases:
+                for q in (0.0, 50.0, 99.9, 100.0):
+                    with self.subTest(kernel=kernel, n=values.size, q=q, values=values):
+                        got = kernel(np.array(values, dtype=np.float64), q)
+                        self.assertAlmostEqual(got, float(np.percentile(np.abs(values), q)), places=12)
+
+
+def _reference_tree_nodes(tree, node_count: int) -> list:
+    # The per-node loop _train_tree used before the bulk ndarray conversion.
+    nodes = []
+    for idx in range(tree.node_count):
+        feature = int(tree.feature[idx])
+        if feature < 0:
+            nodes.append({"feature": -1, "threshold": 0.0, "left": -1, "right": -1, "value": float(tree.value[idx][0][0])})
+        else:
+            nodes.append(
+                {
+                    "feature": feature,
+                    "threshold": float(tree.threshold[idx]),
+                    "left": int(tree.children_left[idx]),
+                    "right": int(tree.children_right[idx]),
+                    "value": float(tree.value[idx][0][0]),
+                }
+            )
+    while len(nodes) < node_count:
+        nodes.append({"feature": -1, "threshold": 0.0, "left": -1, "right": -1, "value": 0.0})
+    return nodes
+
+
+@_requires_numpy
+class TrainTreeTests(unittest.TestCase):
+    _MANIFEST = {"build": {"tree_node_count": 12}}
+
+    def _fixed_data(self):
+        x = np.array([[0.0, 1.0], [1.0, 0.5], [2.0, 2.5], [3.0, 0.0], [4.0, 3.5], [5.0, 1.5]], dtype=np.float32)
+        y = np.array([0.1, 0.4, 1.7, 2.2, 3.9, 5.3], dtype=np.float32)
+        return {"x": x, "y": y}
+
+    def _train_capturing_tree(self, regressor_cls):
+        fitted = []
+
+        def build(**kwargs):
+            model = regressor_cls(**kwargs)
+            fitted.append(model)
+            return model
+
+        with patch("sklearn.tree.DecisionTreeRegressor", side_effect=build):
+            weights = training._train_tree(self._MANIFEST, self._fixed_data(), max_depth=3)
+        return weights["nodes"], fitted[0].tree_
+
+    def test_node_list_matches_per_node_loop(self) -> None:
+        tree = SimpleNamespace(
+            node_count=5,
+            feature=np.array([0, -2, 1, -2, -2], dtype=np.intp),
+            threshold=np.array([2.5, -2.0, 0.75, -2.0, -2.0], dtype=np.float64),
+            children_left=np.array([1, -1, 3, -1, -1], dtype=np.intp),
+            children_right=np.array([2, -1, 4, -1, -1], dtype=np.intp),
+            value=np.array([[[1.9]], [[0.7]], [[3.1]], [[2.2]], [[4.6]]], dtype=np.float64),
+        )
+
+        class FakeRegressor:
+            def __init__(self, **_kwargs) -> None:
+                self.tree_ = tree
+
+            def fit(self, _x, _y) -> None:
+                pass
+
+        fake_tree_module = ModuleType("sklearn.tree")
+        fake_tree_module.DecisionTreeRegressor = FakeRegressor
+        fake_sklearn = ModuleType("sklearn")
+        fake_sklearn.tree = fake_tree_module
+        training._require_sklearn.cache_clear()
+        self.addCleanup(training._require_sklearn.cache_clear)
+        with patch.dict(sys.modules, {"sklearn": fake_sklearn, "sklearn.tree": fake_tree_module}):
+            nodes, fitted = self._train_capturing_tree(FakeRegressor)
+        self.assertEqual(json.dumps(nodes), json.dumps(_reference_tree_nodes(fitted, 12)))
+
+    @unittest.skipUnless(importlib.util.find_spec("sklearn"), "scikit-learn not installed")
+    def test_node_list_matches_per_node_loop_with_sklearn(self) -> None:
+        from sklearn.tree import DecisionTreeRegressor
+
+        nodes, fitted = self._train_capturing_tree(DecisionTreeRegressor)
+        self.assertEqual(json.dumps(nodes), json.dumps(_reference_tree_nodes(fitted, 12)))
+
+
+class CompiledModelTests(unittest.TestCase):
+    class _Batch:
+        def __init__(self, size: int) -> None:
+            self.shape = (size, 4)
+
+    def test_compile_defaults_to_cuda_only(self) -> None:
+        torch = SimpleNamespace(compile=Mock(side_effect=AssertionError("must not compile")))
+        model = object()
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIs(training._maybe_compile(model, torch, "cpu"), model)
+        with patch.dict(os.environ, {"CAULDRON_COMPILE": "0"}):
+            self.assertIs(training._maybe_compile(model, torch, "cuda"), model)
+
+    def test_short_batch_runs_eagerly(self) -> None:
+        compiled, eager = Mock(return_value="compiled"), Mock(return_value="eager")
+        wrapper = training._CompiledModel(compiled, eager, (ValueError,))
+        self.assertEqual(wrapper(self._Batch(32)), "compiled")
+        self.assertEqual(wrapper(self._Batch(32)), "compiled")
+        self.assertEqual(wrapper(self._Batch(7)), "eager")
+        self.assertEqual(compiled.call_count, 2)
+
+    def test_compile_error_falls_back_to_eager(self) -> None:
+        compiled, eager = Mock(side_effect=ValueError("backend failed")), Mock(return_value="eager")
+        wrapper = training._CompiledModel(compiled, eager, (ValueError,))
+        with redirect_stderr(io.StringIO()) as err:
+            self.assertEqual(wrapper(self._Batch(8)), "eager")
+            self.assertEqual(wrapper(self._Batch(8)), "eager")
+        compiled.assert_called_once()
+        self.assertIn("backend failed", err.getvalue())
+
+    def test_other_errors_propagate(self) -> None:
+        wrapper = training._CompiledModel(Mock(side_effect=KeyError("bug")), Mock(), (ValueError,))
+        with self.assertRaises(KeyError):
+            wrapper(self._Batch(8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import base64
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from cauldron.tui import _cache, commands
+from cauldron.tui.state import ProjectInfo
+
+_METAS_INFO = {
+    "rpc_url": "https://api.devnet.solana.com",
+    "program_id": "Prog111111111111111111111111111111111111111",
+    "authority_pubkey": "Auth111111111111111111111111111111111111111",
+    "vm_seed": "7",
+    "vm_pubkey": "Vm11111111111111111111111111111111111111111",
+}
+
+
+class SeedCollisionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        commands._COLLISION_INDEX = None
+        commands._FP_CACHE.clear()
+        _cache.clear_caches()
+        patches = [
+            patch.object(commands, "REGISTRY_PATH", self.root / "registry.toml"),
+            patch.object(commands, "get_defaults", return_value={}),
+            patch("cauldron.tui.runtime.get_defaults", return_value={}),
+            patch.object(_cache, "accounts_segment_metas", return_value=(_METAS_INFO, [])),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(_cache.clear_caches)
+
+    def _project(self, name: str) -> ProjectInfo:
+        path = self.root / name
+        path.mkdir()
+        (path / "accounts.toml").write_text("[vm]\nseed = 7\n")
+        return ProjectInfo(
+            name=name,
+            path=path,
+            manifest_path=path / "manifest.toml",
+            accounts_path=Path("accounts.toml"),
+        )
+
+    def test_project_does_not_collide_with_itself(self) -> None:
+        project = self._project("alpha")
+        with patch.object(commands, "list_projects", return_value=[project]):
+            found = commands._detect_seed_collision(
+                accounts_path=project.path / "accounts.toml",
+                project_path=project.path,
+            )
+        self.assertIsNone(found)
+
+    def test_other_project_with_same_seed_collides(self) -> None:
+        alpha = self._project("alpha")
+        beta = self._project("beta")
+        with patch.object(commands, "list_projects", return_value=[alpha, beta]):
+            found = commands._detect_seed_collision(
+                accounts_path=alpha.path / "accounts.toml",
+                project_path=alpha.path,
+            )
+        self.assertIsNotNone(found)
+        self.assertEqual(found[0].name, "beta")
+
+
+def _account_value(data: bytes, *, padded: bool = True) -> dict:
+    text = base64.b64encode(data).decode("ascii")
+    if not padded:
+        text = text.rstrip("=")
+    return {"owner": "Owner1111", "lamports": len(data) + 1, "data": [text, "base64"], "executable": False}
+
+
+class AccountSnapshotTests(unittest.TestCase):
+    def test_data_len_for_padded_and_unpadded_base64(self) -> None:
+        for size in range(0, 10):
+            data = bytes(range(size))
+            for padded in (True, False):
+                with self.subTest(size=size, padded=padded):
+                    snapshot = commands._account_snapshot_from_value(_account_value(data, padded=padded))
+                    self.assertEqual(snapshot["data_len"], size)
+
+    def test_large_key_lists_are_split_at_the_rpc_limit(self) -> None:
+        pubkeys = [f"Key{idx}" for idx in range(205)]
+        batches = []
+
+        def fake_rpc(_url, method, params):
+            self.assertEqual(method, "getMultipleAccounts")
+            batch = params[0]
+            batches.append(list(batch))
+            values = [_account_value(bytes(int(key[3:]) % 7)) for key in batch]
+            return {"result": {"value": values}}
+
+        with patch.object(commands, "rpc_request_raw", side_effect=fake_rpc):
+            snapshots = commands._fetch_account_snapshots("http://rpc.local", pubkeys)
+
+        self.assertEqual([len(batch) for batch in batches], [100, 100, 5])
+        self.assertEqual([key for batch in batches for key in batch], pubkeys)
+        self.assertEqual([snap["data_len"] for snap in snapshots], [idx % 7 for idx in range(205)])
+
+    def test_errors_and_missing_accounts_stay_aligned(self) -> None:
+        pubkeys = [f"Key{idx}" for idx in range(103)]
+
+        def fake_rpc(_url, _method, params):
+            batch = params[0]
+            if batch[0] == "Key100":
+                return {"error": {"code": -32005, "message": "node is behind"}}
+            values = [None if key in ("Key3", "Key99") else _account_value(b"\x01\x02") for key in batch]
+            return {"result": {"value": values}}
+
+        with patch.object(commands, "rpc_request_raw", side_effect=fake_rpc):
+            snapshots = commands._fetch_account_snapshots("http://rpc.local", pubkeys)
+
+        self.assertEqual(len(snapshots), 103)
+        for idx, snap in enumerate(snapshots):
+            with self.subTest(idx=idx):
+                if idx in (3, 99):
+                    self.assertIsInstance(snap, ValueError)
+                    self.assertIn("account not found", str(snap))
+                elif idx >= 100:
+                    self.assertIsInstance(snap, ValueError)
+                    self.assertIn("node is behind", str(snap))
+                else:
+                    self.assertEqual(snap["data_len"], 2)
+
+    def test_short_value_list_fails_the_whole_batch(self) -> None:
+        with patch.object(commands, "rpc_request_raw", return_value={"result": {"value": [None]}}):
+            snapshots = commands._fetch_account_snapshots("http://rpc.local", ["A", "B"])
+        self.assertEqual(len(snapshots), 2)
+        self.assertTrue(all(isinstance(snap, ValueError) for snap in snapshots))
+
+
+if __name__ == "__main__":
+    unittest.main()